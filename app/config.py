@@ -45,6 +45,7 @@ class SalesforceConfig(BaseSettings):
 
     # Development
     debug_mode: bool = Field(default=False, description="Enable debug mode")
+    pretty_json: bool = Field(default=False, description="Indent JSON tool responses (for debugging)")
 
     # HTTP/SSE Server Configuration
     http_host: str = Field(default="0.0.0.0", description="HTTP server host (0.0.0.0 for network access)")
@@ -7,7 +7,7 @@ import json
 from typing import Optional
 
 from app.mcp.server import register_tool
-from app.services.salesforce import get_salesforce_connection
+from app.services.salesforce import get_salesforce_connection, get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -162,7 +162,7 @@ def abort_batch_job(job_id: str) -> str:
         sf = get_salesforce_connection()
 
         # Abort the job via Tooling API
-        import requests
+        http = get_http_session()
         endpoint = f"{sf.base_url}tooling/sobjects/AsyncApexJob/{job_id}"
         headers = {
             "Authorization": f"Bearer {sf.session_id}",
@@ -172,7 +172,7 @@ def abort_batch_job(job_id: str) -> str:
         # Update job status to Aborted
         update_data = {"Status": "Aborted"}
 
-        response = requests.patch(endpoint, headers=headers, json=update_data, timeout=30)
+        response = http.patch(endpoint, headers=headers, json=update_data, timeout=30)
         response.raise_for_status()
 
         return json.dumps({
@@ -202,11 +202,11 @@ def delete_scheduled_job(job_id: str) -> str:
         sf = get_salesforce_connection()
 
         # Delete via Tooling API
-        import requests
+        http = get_http_session()
         endpoint = f"{sf.base_url}tooling/sobjects/CronTrigger/{job_id}"
         headers = {"Authorization": f"Bearer {sf.session_id}"}
 
-        response = requests.delete(endpoint, headers=headers, timeout=30)
+        response = http.delete(endpoint, headers=headers, timeout=30)
         response.raise_for_status()
 
         return json.dumps({
@@ -236,14 +236,14 @@ def execute_anonymous_apex(apex_code: str) -> str:
         sf = get_salesforce_connection()
 
         # Execute via REST API
-        import requests
+        http = get_http_session()
         import urllib.parse
 
         endpoint = f"{sf.base_url}tooling/executeAnonymous"
         headers = {"Authorization": f"Bearer {sf.session_id}"}
 
         params = {"anonymousBody": apex_code}
-        response = requests.get(endpoint, headers=headers, params=params, timeout=60)
+        response = http.get(endpoint, headers=headers, params=params, timeout=60)
         response.raise_for_status()
 
         result = response.json()
@@ -328,11 +328,11 @@ def get_debug_log_body(log_id: str) -> str:
         sf = get_salesforce_connection()
 
         # Fetch log body via Tooling API
-        import requests
+        http = get_http_session()
         endpoint = f"{sf.base_url}tooling/sobjects/ApexLog/{log_id}/Body"
         headers = {"Authorization": f"Bearer {sf.session_id}"}
 
-        response = requests.get(endpoint, headers=headers, timeout=30)
+        response = http.get(endpoint, headers=headers, timeout=30)
         response.raise_for_status()
 
         log_body = response.text
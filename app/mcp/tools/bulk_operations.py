@@ -10,7 +10,7 @@ import csv
 from typing import List, Dict, Any, Optional
 
 from app.mcp.server import register_tool
-from app.services.salesforce import get_salesforce_connection
+from app.services.salesforce import get_salesforce_connection, get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +53,7 @@ def bulk_insert_records(
             return json.dumps({"success": False, "error": "Empty records list"})
 
         # Create bulk job
-        import requests
+        http = get_http_session()
         job_endpoint = f"{sf.base_url}jobs/ingest"
         headers = {
             "Authorization": f"Bearer {sf.session_id}",
@@ -66,7 +66,7 @@ def bulk_insert_records(
             "lineEnding": "CRLF"
         }
 
-        response = requests.post(job_endpoint, headers=headers, json=job_data, timeout=30)
+        response = http.post(job_endpoint, headers=headers, json=job_data, timeout=30)
         response.raise_for_status()
         job_info = response.json()
         job_id = job_info["id"]
@@ -80,14 +80,14 @@ def bulk_insert_records(
             "Content-Type": "text/csv"
         }
 
-        response = requests.put(upload_endpoint, headers=upload_headers, data=csv_data, timeout=60)
+        response = http.put(upload_endpoint, headers=upload_headers, data=csv_data, timeout=60)
         response.raise_for_status()
 
         # Close job to start processing
         close_endpoint = f"{job_endpoint}/{job_id}"
         close_data = {"state": "UploadComplete"}
 
-        response = requests.patch(close_endpoint, headers=headers, json=close_data, timeout=30)
+        response = http.patch(close_endpoint, headers=headers, json=close_data, timeout=30)
         response.raise_for_status()
 
         logger.info(f"Started processing bulk job: {job_id}")
@@ -103,7 +103,7 @@ def bulk_insert_records(
         # Poll for completion
         start_time = time.time()
         while time.time() - start_time < timeout_seconds:
-            status_response = requests.get(close_endpoint, headers=headers, timeout=30)
+            status_response = http.get(close_endpoint, headers=headers, timeout=30)
             status_response.raise_for_status()
             job_status = status_response.json()
 
@@ -124,7 +124,7 @@ def bulk_insert_records(
                 # Get failed records if any
                 if job_status.get("numberRecordsFailed", 0) > 0:
                     failed_endpoint = f"{job_endpoint}/{job_id}/failedResults"
-                    failed_response = requests.get(failed_endpoint, headers={"Authorization": f"Bearer {sf.session_id}"}, timeout=30)
+                    failed_response = http.get(failed_endpoint, headers={"Authorization": f"Bearer {sf.session_id}"}, timeout=30)
                     if failed_response.status_code == 200:
                         results["failed_records"] = failed_response.text
 
@@ -182,7 +182,7 @@ def bulk_update_records(
         csv_data = csv_buffer.getvalue()
 
         # Create bulk job
-        import requests
+        http = get_http_session()
         job_endpoint = f"{sf.base_url}jobs/ingest"
         headers = {
             "Authorization": f"Bearer {sf.session_id}",
@@ -195,7 +195,7 @@ def bulk_update_records(
             "lineEnding": "CRLF"
         }
 
-        response = requests.post(job_endpoint, headers=headers, json=job_data, timeout=30)
+        response = http.post(job_endpoint, headers=headers, json=job_data, timeout=30)
         response.raise_for_status()
         job_info = response.json()
         job_id = job_info["id"]
@@ -207,12 +207,12 @@ def bulk_update_records(
             "Content-Type": "text/csv"
         }
 
-        response = requests.put(upload_endpoint, headers=upload_headers, data=csv_data, timeout=60)
+        response = http.put(upload_endpoint, headers=upload_headers, data=csv_data, timeout=60)
         response.raise_for_status()
 
         close_endpoint = f"{job_endpoint}/{job_id}"
         close_data = {"state": "UploadComplete"}
-        response = requests.patch(close_endpoint, headers=headers, json=close_data, timeout=30)
+        response = http.patch(close_endpoint, headers=headers, json=close_data, timeout=30)
         response.raise_for_status()
 
         if not wait_for_completion:
@@ -225,7 +225,7 @@ def bulk_update_records(
         # Poll for completion (similar to insert)
         start_time = time.time()
         while time.time() - start_time < timeout_seconds:
-            status_response = requests.get(close_endpoint, headers=headers, timeout=30)
+            status_response = http.get(close_endpoint, headers=headers, timeout=30)
             status_response.raise_for_status()
             job_status = status_response.json()
 
@@ -285,7 +285,7 @@ def bulk_delete_records(
         csv_data = csv_buffer.getvalue()
 
         # Create delete job
-        import requests
+        http = get_http_session()
         job_endpoint = f"{sf.base_url}jobs/ingest"
         headers = {
             "Authorization": f"Bearer {sf.session_id}",
@@ -298,7 +298,7 @@ def bulk_delete_records(
             "lineEnding": "CRLF"
         }
 
-        response = requests.post(job_endpoint, headers=headers, json=job_data, timeout=30)
+        response = http.post(job_endpoint, headers=headers, json=job_data, timeout=30)
         response.raise_for_status()
         job_id = response.json()["id"]
 
@@ -309,11 +309,11 @@ def bulk_delete_records(
             "Content-Type": "text/csv"
         }
 
-        response = requests.put(upload_endpoint, headers=upload_headers, data=csv_data, timeout=60)
+        response = http.put(upload_endpoint, headers=upload_headers, data=csv_data, timeout=60)
         response.raise_for_status()
 
         close_endpoint = f"{job_endpoint}/{job_id}"
-        response = requests.patch(close_endpoint, headers=headers, json={"state": "UploadComplete"}, timeout=30)
+        response = http.patch(close_endpoint, headers=headers, json={"state": "UploadComplete"}, timeout=30)
         response.raise_for_status()
 
         if not wait_for_completion:
@@ -322,7 +322,7 @@ def bulk_delete_records(
         # Poll for completion
         start_time = time.time()
         while time.time() - start_time < timeout_seconds:
-            status_response = requests.get(close_endpoint, headers=headers, timeout=30)
+            status_response = http.get(close_endpoint, headers=headers, timeout=30)
             job_status = status_response.json()
 
             if job_status["state"] in ["JobComplete", "Failed", "Aborted"]:
@@ -358,11 +358,11 @@ def get_bulk_job_status(job_id: str) -> str:
     try:
         sf = get_salesforce_connection()
 
-        import requests
+        http = get_http_session()
         endpoint = f"{sf.base_url}jobs/ingest/{job_id}"
         headers = {"Authorization": f"Bearer {sf.session_id}"}
 
-        response = requests.get(endpoint, headers=headers, timeout=30)
+        response = http.get(endpoint, headers=headers, timeout=30)
         response.raise_for_status()
         job_status = response.json()
 
@@ -99,6 +99,9 @@ def deploy_metadata(
     Content format by type:
     - ApexClass: {"body": "public class...", "apiVersion": "59.0"}
     - ApexTrigger: {"body": "trigger...", "tableName": "Account", "apiVersion": "59.0"}
+        Optional proofs, checked in one round-trip before deploying:
+        "requiredObjects": ["Invoice__c"], "requiredFields": ["Invoice__c.Code__c"],
+        "requiredClasses": ["InvoiceService"]
     - CustomField (Text): {"label": "Customer Code", "type": "Text", "length": 50}
     - CustomField (Picklist):
         Format 1: {"label": "Status", "type": "Picklist", "picklistValues": ["New", "In Progress", "Done"]}
@@ -160,14 +163,20 @@ def deploy_metadata(
                     trigger_name=name,
                     body=content_dict.get("body", ""),
                     table_name=content_dict.get("tableName", content_dict.get("objectName", "")),
-                    api_version=content_dict.get("apiVersion", "59.0")
+                    api_version=content_dict.get("apiVersion", "59.0"),
+                    required_objects=content_dict.get("requiredObjects"),
+                    required_fields=content_dict.get("requiredFields"),
+                    required_classes=content_dict.get("requiredClasses")
                 )
             else:
                 return dynamic_tools.upsert_apex_trigger(
                     trigger_name=name,
                     body=content_dict.get("body", ""),
                     table_name=content_dict.get("tableName", content_dict.get("objectName", "")),
-                    api_version=content_dict.get("apiVersion", "59.0")
+                    api_version=content_dict.get("apiVersion", "59.0"),
+                    required_objects=content_dict.get("requiredObjects"),
+                    required_fields=content_dict.get("requiredFields"),
+                    required_classes=content_dict.get("requiredClasses")
                 )
 
         elif normalized_type in ["ValidationRule", "validation"]:
@@ -457,7 +466,8 @@ def deploy_metadata(
 def fetch_metadata(
     metadata_type: str,
     name: str,
-    include_body: bool = True
+    include_body: bool = True,
+    mode: str = "full"
 ) -> str:
     """
     Fetch Salesforce metadata by type and name. Supports 16 metadata types.
@@ -486,6 +496,8 @@ def fetch_metadata(
         metadata_type: Type of metadata (see supported types)
         name: API name (e.g., "AccountService", "Account.Customer_Code__c")
         include_body: Include full source code/body (for Apex/LWC)
+        mode: ApexTrigger only - "full" (default), "summary" (no body or actor
+              names) or "symbols" (compiled SymbolTable instead of the body)
 
     Returns:
         JSON response with metadata details
@@ -499,6 +511,9 @@ def fetch_metadata(
 
         # Fetch without body (faster)
         fetch_metadata("ApexClass", "AccountService", include_body=False)
+
+        # Trigger metadata only (no body, no actor joins)
+        fetch_metadata("ApexTrigger", "AccountTrigger", mode="summary")
     """
     try:
         # Normalize metadata type
@@ -509,7 +524,7 @@ def fetch_metadata(
             return dynamic_tools.fetch_apex_class(name)
 
         elif normalized_type in ["ApexTrigger", "trigger"]:
-            return dynamic_tools.fetch_apex_trigger(name)
+            return dynamic_tools.fetch_apex_trigger(name, include_body=include_body, mode=mode)
 
         elif normalized_type in ["ValidationRule", "validation"]:
             object_name, rule_name = name.split(".", 1) if "." in name else (None, name)
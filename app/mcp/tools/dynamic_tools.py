@@ -1,21 +1,32 @@
 import logging
-import requests
-import json
 import time
 import zipfile
 import io
+import random
+import tempfile
 import re
-from typing import Optional, Dict, Any, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import IO, Optional, Dict, Any, Iterator, List, Tuple, Union, Callable
 from lxml import etree
 import base64
+import hashlib
+from urllib.parse import quote_plus
+from xml.sax.saxutils import escape as _xml_escape
 
 from app.mcp.server import register_tool
-from app.services.salesforce import get_salesforce_connection
+from app.services.salesforce import get_salesforce_connection, get_http_session
 from app.utils.validators import validate_soql_query, validate_api_name, ValidationError
+from app.utils.cache import SingleFlight, TTLCache
 from app.mcp.tools.utils import (
+    dumps_json,
+    loads_json,
     format_error_response,
     format_success_response,
-    ResponseSizeManager
+    ResponseSizeManager,
+    TOKEN_LIMIT,
 )
 
 logger = logging.getLogger(__name__)
@@ -23,31 +34,165 @@ logger = logging.getLogger(__name__)
 
 
 # Simple validator for LWC bundle names: must start with lowercase letter and contain only letters, numbers, or underscores.
+_LWC_NAME_RE = re.compile(r"^[a-z][A-Za-z0-9_]*$")
+
+
+# Name check used by create/upsert_lwc_component: letters, digits, "_" and "-".
+_LWC_COMPONENT_NAME_RE = re.compile(r"[A-Za-z0-9_-]+")
+
+
 def _validate_lwc_bundle_name(name: str) -> bool:
     try:
-        return bool(re.match(r"^[a-z][A-Za-z0-9_]*$", name))
+        return bool(_LWC_NAME_RE.match(name))
     except Exception:
         return False
+
+
+# Apex trigger/class and validation rule names: letter first, then
+# letters/digits/underscores, max 40 chars.
+# One precompiled match replaces the old `replace("_", "").isalnum()` checks.
+_NAME_RE = re.compile(r"\A[A-Za-z][A-Za-z0-9_]{0,39}\Z")
+# Field API names (standard, custom or namespaced): identifier-shaped.
+_FIELD_NAME_RE = re.compile(r"\A[A-Za-z][A-Za-z0-9_]*\Z")
+_DEFAULT_API_VERSION = "59.0"
+# Prebuilt at import time, so pinned to compact output: SFMCP_PRETTY_JSON
+# applies to responses serialized per call, not to these constants.
+_ERR_INVALID_TRIGGER_NAME = dumps_json(
+    {"success": False, "error": "Invalid trigger name. Use only alphanumeric characters and underscores."},
+    pretty=False,
+)
+# %-templates for the common guard-clause errors; only ever filled with names
+# that already passed _NAME_RE, so no JSON escaping is needed.
+_ERR_TRIGGER_EXISTS_FMT = dumps_json(
+    {"success": False, "error": "Apex trigger '%s' already exists. Use upsert_apex_trigger to update it."},
+    pretty=False,
+)
+_ERR_TRIGGER_NOT_FOUND_FMT = dumps_json({"success": False, "error": "%s not found"}, pretty=False)
+_ERR_TRIGGER_NOT_FOUND_UPSERT_FMT = dumps_json(
+    {"success": False, "error": "%s not found (use create_apex_trigger to create new triggers)"},
+    pretty=False,
+)
+# LWC guard-clause errors (the %-template is only filled with validated names)
+_ERR_LWC_INVALID_NAME = dumps_json(
+    {"success": False, "error": "Invalid component name. Use only alphanumeric characters, underscores, and hyphens."},
+    pretty=False,
+)
+_ERR_LWC_INVALID_NAME_UPSERT = dumps_json(
+    {"success": False, "error": "Invalid component name. Use only letters, numbers, underscores, and hyphens."},
+    pretty=False,
+)
+_ERR_LWC_EXISTS_FMT = dumps_json(
+    {"success": False, "error": "LWC component '%s' already exists. Use upsert_lwc_component to update it."},
+    pretty=False,
+)
+_ERR_LWC_NOT_FOUND = dumps_json({"success": False, "error": "Component not found"}, pretty=False)
+_ERR_LWC_NOT_FOUND_UPSERT = dumps_json(
+    {"success": False, "error": "Component not found (use create_lwc_component to create new components)"},
+    pretty=False,
+)
+_ERR_LWC_MISSING_HTML = dumps_json({"success": False, "error": "Missing required file content: html"}, pretty=False)
+_ERR_LWC_MISSING_JS = dumps_json({"success": False, "error": "Missing required file content: js"}, pretty=False)
+
+
+_SOQL_ESCAPE = str.maketrans({"\\": "\\\\", "'": "\\'"})
+
+
+def _soql_quote(value: str) -> str:
+    """Return `value` as an escaped SOQL string literal (including the quotes)."""
+    # API names are identifiers and never need escaping
+    if value.isidentifier():
+        return "'" + value + "'"
+    return "'" + value.translate(_SOQL_ESCAPE) + "'"
+
+
+def _nested(d: Optional[Dict[str, Any]], *keys: str) -> Any:
+    """Walk `d` by `keys`, returning None at the first missing/null level."""
+    for key in keys:
+        if not d:
+            return None
+        d = d.get(key)
+    return d
+
+
+def _body_digest(source: str) -> bytes:
+    """Short content hash used to detect no-op source updates."""
+    return hashlib.blake2b(source.encode("utf-8"), digest_size=16).digest()
+
+
+def _tooling_query(sf_connection, soql: str) -> Dict[str, Any]:
+    """Run a Tooling SOQL query, passing the text as a properly encoded `q` param.
+
+    Goes through simple_salesforce's request path (auth headers, error mapping)
+    but decodes the raw body with `loads_json`, which is much faster than
+    `Response.json()` for large `Body` payloads.
+    """
+    resp = sf_connection._call_salesforce(
+        "GET", f"{sf_connection.tooling_url}query/", name="toolingexecute", params={"q": soql}
+    )
+    return loads_json(resp.content)
+
+
+def _iter_tooling_records(sf_connection, page: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield the records of a Tooling query result, following `nextRecordsUrl`.
+
+    Pages are fetched lazily as the caller consumes them, so only one page is
+    held in memory at a time.
+    """
+    while True:
+        yield from page.get("records") or []
+        next_url = page.get("nextRecordsUrl")
+        if page.get("done", True) or not next_url:
+            return
+        resp = sf_connection._call_salesforce(
+            "GET", f"https://{sf_connection.sf_instance}{next_url}", name="toolingexecute"
+        )
+        page = loads_json(resp.content)
+
+
 # =============================================================================
 # INTERNAL HELPERS – PACKAGE / XML GENERATORS
 # =============================================================================
 
+# Fixed-shape metadata documents are rendered from templates in one pass;
+# every substituted value goes through _xml_escape exactly once.
+_PACKAGE_XML_TMPL = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<Package xmlns="http://soap.sforce.com/2006/04/metadata">'
+    '<types>{members}<name>{type}</name></types>'
+    '<version>{version}</version>'
+    '</Package>'
+)
+
+_CUSTOM_OBJECT_XML_TMPL = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<CustomObject xmlns="http://soap.sforce.com/2006/04/metadata">'
+    '<label>{label}</label>'
+    '<pluralLabel>{plural_label}</pluralLabel>'
+    '{description}'
+    '<sharingModel>{sharing_model}</sharingModel>'
+    '<deploymentStatus>{deployment_status}</deploymentStatus>'
+    '<enableActivities>true</enableActivities>'
+    '<enableReports>true</enableReports>'
+    '<enableSearch>true</enableSearch>'
+    '<nameField><label>{label} Name</label><type>Text</type></nameField>'
+    '</CustomObject>'
+)
+
+
 def _generate_package_xml(members: List[str], metadata_type: str, api_version: str) -> str:
     """Generate a package.xml with one or more members of a single metadata type."""
-    PNS = "http://soap.sforce.com/2006/04/metadata"
-    root = etree.Element(etree.QName(PNS, "Package"), nsmap={None: PNS})
-
-    types_tag = etree.SubElement(root, etree.QName(PNS, "types"))
-    for m in members:
-        etree.SubElement(types_tag, etree.QName(PNS, "members")).text = m
-    etree.SubElement(types_tag, etree.QName(PNS, "name")).text = metadata_type
+    return _PACKAGE_XML_TMPL.format_map({
+        "members": "".join(f"<members>{_xml_escape(m)}</members>" for m in members),
+        "type": _xml_escape(metadata_type),
+        "version": _xml_escape(str(api_version)),
+    })
 
-    version_tag = etree.SubElement(root, etree.QName(PNS, "version"))
-    version_tag.text = api_version
 
-    return etree.tostring(
-        root, encoding="UTF-8", xml_declaration=True, pretty_print=True
-    ).decode("utf-8")
+@lru_cache(maxsize=128)
+def _cached_package_xml(members: Tuple[str, ...], metadata_type: str, api_version: str) -> str:
+    """`_generate_package_xml` memoized on (members, type, version); repeated
+    object/field deploys re-use the rendered string."""
+    return _generate_package_xml(list(members), metadata_type, api_version)
 
 
 def _generate_custom_object_xml(
@@ -58,34 +203,26 @@ def _generate_custom_object_xml(
     deployment_status: str = "Deployed",
 ) -> str:
     """Return CustomObject-level XML (no <fields/>)."""
-    PNS = "http://soap.sforce.com/2006/04/metadata"
-    root = etree.Element(etree.QName(PNS, "CustomObject"), nsmap={None: PNS})
-
-    etree.SubElement(root, etree.QName(PNS, "label")).text = object_label
-    etree.SubElement(root, etree.QName(PNS, "pluralLabel")).text = plural_label
-    if description:
-        etree.SubElement(root, etree.QName(PNS, "description")).text = description
-    etree.SubElement(root, etree.QName(PNS, "sharingModel")).text = sharing_model
-    etree.SubElement(root, etree.QName(PNS, "deploymentStatus")).text = deployment_status
-    etree.SubElement(root, etree.QName(PNS, "enableActivities")).text = "true"
-    etree.SubElement(root, etree.QName(PNS, "enableReports")).text = "true"
-    etree.SubElement(root, etree.QName(PNS, "enableSearch")).text = "true"
-
-    # Required name field
-    name_field = etree.SubElement(root, etree.QName(PNS, "nameField"))
-    etree.SubElement(name_field, etree.QName(PNS, "label")).text = f"{object_label} Name"
-    etree.SubElement(name_field, etree.QName(PNS, "type")).text = "Text"
-
-    return etree.tostring(
-        root, encoding="UTF-8", xml_declaration=True, pretty_print=True
-    ).decode("utf-8")
+    return _CUSTOM_OBJECT_XML_TMPL.format_map({
+        "label": _xml_escape(object_label),
+        "plural_label": _xml_escape(plural_label),
+        "description": f"<description>{_xml_escape(description)}</description>" if description else "",
+        "sharing_model": _xml_escape(sharing_model),
+        "deployment_status": _xml_escape(deployment_status),
+    })
 
 
 
 def _generate_custom_object_with_field(object_name: str, field_config: Dict[str, Any]) -> str:
+    """Return CustomObject XML wrapping a single <fields> block.
+
+    The namespace is declared once on the root; children never re-declare it.
+    """
     PNS = "http://soap.sforce.com/2006/04/metadata"
     root = etree.Element(etree.QName(PNS, "CustomObject"), nsmap={None: PNS})
 
+    t = field_config["type"]
+    fc_get = field_config.get
     is_custom = object_name.endswith("__c")
 
     # Only include <fullName> for custom objects
@@ -96,10 +233,9 @@ def _generate_custom_object_with_field(object_name: str, field_config: Dict[str,
     f = etree.SubElement(root, etree.QName(PNS, "fields"))
     etree.SubElement(f, etree.QName(PNS, "fullName")).text = field_config["fullName"]             # e.g., Customer_Code__c
     etree.SubElement(f, etree.QName(PNS, "label")).text = field_config["label"]
-    etree.SubElement(f, etree.QName(PNS, "type")).text  = field_config["type"]
+    etree.SubElement(f, etree.QName(PNS, "type")).text  = t
 
     # ---- Type-specific attrs ----
-    t = field_config["type"]
     if t in {"Text", "LongTextArea"} and "length" in field_config:
         etree.SubElement(f, etree.QName(PNS, "length")).text = str(field_config["length"])
     if t == "LongTextArea":
@@ -110,7 +246,7 @@ def _generate_custom_object_with_field(object_name: str, field_config: Dict[str,
             etree.SubElement(f, etree.QName(PNS, "precision")).text = str(field_config["precision"])
         if "scale" in field_config:
             etree.SubElement(f, etree.QName(PNS, "scale")).text = str(field_config["scale"])
-    if t in {"Picklist", "MultiselectPicklist"} and field_config.get("picklistValues"):
+    if t in {"Picklist", "MultiselectPicklist"} and fc_get("picklistValues"):
         vs = etree.SubElement(f, etree.QName(PNS, "valueSet"))
         etree.SubElement(vs, etree.QName(PNS, "restricted")).text = "true"
         vsd = etree.SubElement(vs, etree.QName(PNS, "valueSetDefinition"))
@@ -119,7 +255,7 @@ def _generate_custom_object_with_field(object_name: str, field_config: Dict[str,
             etree.SubElement(v, etree.QName(PNS, "fullName")).text = pv["fullName"]
             etree.SubElement(v, etree.QName(PNS, "label")).text    = pv.get("label", pv["fullName"])
             etree.SubElement(v, etree.QName(PNS, "default")).text  = str(pv.get("default", False)).lower()
-    if t in {"Lookup", "MasterDetail"} and field_config.get("referenceTo"):
+    if t in {"Lookup", "MasterDetail"} and fc_get("referenceTo"):
         etree.SubElement(f, etree.QName(PNS, "referenceTo")).text = field_config["referenceTo"]
         if "relationshipLabel" in field_config:
             etree.SubElement(f, etree.QName(PNS, "relationshipLabel")).text = field_config["relationshipLabel"]
@@ -132,74 +268,20 @@ def _generate_custom_object_with_field(object_name: str, field_config: Dict[str,
     for tag in ("required", "unique", "externalId"):
         if tag in field_config:
             etree.SubElement(f, etree.QName(PNS, tag)).text = str(field_config[tag]).lower()
-    if field_config.get("description"):
+    if fc_get("description"):
         etree.SubElement(f, etree.QName(PNS, "description")).text = field_config["description"]
 
-    return _pretty_xml(root)
+    return _compact_xml(root)
 
 
-def _pretty_xml(node) -> str:
-    """Return pretty-printed XML string with declaration."""
+def _compact_xml(node) -> str:
+    """Return XML string without indentation whitespace (smaller deploy ZIPs)."""
     return etree.tostring(
-        node, encoding="UTF-8", xml_declaration=True, pretty_print=True
+        node, encoding="UTF-8", xml_declaration=True, pretty_print=False
     ).decode("utf-8")
 
-def _generate_custom_field_xml(field_config: Dict[str, Any]) -> str:
-    """Generate <CustomField> XML for a single field."""
-    PNS = "http://soap.sforce.com/2006/04/metadata"
-    root = etree.Element(etree.QName(PNS, "CustomField"), nsmap={None: PNS})
 
-    # Use just the field name for fullName, not object.field
-    etree.SubElement(root, etree.QName(PNS, "fullName")).text = field_config["fullName"]
-    etree.SubElement(root, etree.QName(PNS, "label")).text = field_config["label"]
-    etree.SubElement(root, etree.QName(PNS, "type")).text = field_config["type"]
-
-    # Length for text fields
-    if field_config["type"] in {"Text", "LongTextArea"} and "length" in field_config:
-        etree.SubElement(root, etree.QName(PNS, "length")).text = str(field_config["length"])
-    
-    # Precision/scale for number fields
-    if field_config["type"] in {"Number", "Currency", "Percent"}:
-        if "precision" in field_config:
-            etree.SubElement(root, etree.QName(PNS, "precision")).text = str(field_config["precision"])
-        if "scale" in field_config:
-            etree.SubElement(root, etree.QName(PNS, "scale")).text = str(field_config["scale"])
-
-    # Optional properties
-    for tag in ("defaultValue", "description"):
-        if tag in field_config and field_config[tag]:
-            etree.SubElement(root, etree.QName(PNS, tag)).text = str(field_config[tag])
-    
-    # Boolean properties
-    for boolean_tag in ("required", "unique", "externalId"):
-        if boolean_tag in field_config:
-            etree.SubElement(root, etree.QName(PNS, boolean_tag)).text = str(field_config[boolean_tag]).lower()
-
-    # Picklist values
-    if field_config["type"] in {"Picklist", "MultiselectPicklist"} and field_config.get("picklistValues"):
-        value_set = etree.SubElement(root, etree.QName(PNS, "valueSet"))
-        restricted = etree.SubElement(value_set, etree.QName(PNS, "restricted")).text = "true"
-        value_set_def = etree.SubElement(value_set, etree.QName(PNS, "valueSetDefinition"))
-        
-        for pv in field_config["picklistValues"]:
-            value = etree.SubElement(value_set_def, etree.QName(PNS, "value"))
-            etree.SubElement(value, etree.QName(PNS, "fullName")).text = pv["fullName"]
-            etree.SubElement(value, etree.QName(PNS, "label")).text = pv.get("label", pv["fullName"])
-            etree.SubElement(value, etree.QName(PNS, "default")).text = str(pv.get("default", False)).lower()
-
-    # Lookup/Master-Detail relationships
-    if field_config["type"] in {"Lookup", "MasterDetail"} and field_config.get("referenceTo"):
-        etree.SubElement(root, etree.QName(PNS, "referenceTo")).text = field_config["referenceTo"]
-        
-        if "relationshipLabel" in field_config:
-            etree.SubElement(root, etree.QName(PNS, "relationshipLabel")).text = field_config["relationshipLabel"]
-        if "relationshipName" in field_config:
-            etree.SubElement(root, etree.QName(PNS, "relationshipName")).text = field_config["relationshipName"]
-
-    return etree.tostring(root, encoding="UTF-8", xml_declaration=True, pretty_print=True).decode("utf-8")
-
-
-def _generate_lwc_meta_xml(component_name: str, description: str = "", api_version: str = "59.0") -> str:
+def _generate_lwc_meta_xml(component_name: str, description: str = "", api_version: str = _DEFAULT_API_VERSION) -> str:
     """Generate the .js-meta.xml file for LWC components."""
     return f"""<?xml version="1.0" encoding="UTF-8"?>
 <LightningComponentBundle xmlns="http://soap.sforce.com/2006/04/metadata">
@@ -214,32 +296,85 @@ def _generate_lwc_meta_xml(component_name: str, description: str = "", api_versi
 </LightningComponentBundle>"""
 
 
+def _generate_apex_meta_xml(metadata_type: str, api_version: str) -> str:
+    """Generate the -meta.xml companion for an ApexClass or ApexTrigger."""
+    PNS = "http://soap.sforce.com/2006/04/metadata"
+    root = etree.Element(etree.QName(PNS, metadata_type), nsmap={None: PNS})
+    etree.SubElement(root, etree.QName(PNS, "apiVersion")).text = str(api_version)
+    etree.SubElement(root, etree.QName(PNS, "status")).text = "Active"
+    return etree.tostring(
+        root, encoding="UTF-8", pretty_print=True, xml_declaration=True
+    ).decode()
+
+
+# =============================================================================
+# INTERNAL HELPERS – PACKAGE ZIP ASSEMBLY
+# =============================================================================
+
+PackageEntry = Tuple[str, Union[str, bytes, Callable[[], Union[str, bytes]]]]
+
+
+# Deploy ZIPs stay in memory up to this size, then spool to a temp file
+_ZIP_SPOOL_MAX = 64 * 1024
+
+
+def _zip_package(entries: List[PackageEntry]) -> IO[bytes]:
+    """Build a deploy ZIP from `(path, content_or_builder)` entries.
+
+    Builders are zero-arg callables around the `_generate_*` helpers, called
+    as their file is written. Small packages stay in memory; large ones (e.g.
+    objects with many picklist values) spool to disk. Level 1 deflate is
+    plenty for metadata XML.
+    """
+    buf = tempfile.SpooledTemporaryFile(max_size=_ZIP_SPOOL_MAX)
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as z:
+        for path, content in entries:
+            z.writestr(path, content() if callable(content) else content)
+    buf.seek(0)
+    return buf
+
+
 # =============================================================================
 # METADATA REST – DEPLOY / POLL
 # =============================================================================
 
-def _execute_metadata_rest_deploy_multipart(
-    sf_connection, zip_buffer: io.BytesIO, check_only: bool = False
-) -> Dict[str, Any]:
-    """Submit a deployment via the REST Metadata endpoint."""
-    endpoint = f"{sf_connection.base_url}metadata/deployRequest"
-    headers = {
+def _auth_headers(sf_connection) -> Dict[str, str]:
+    """Return a fresh auth headers dict for this connection's session.
+
+    Built per call (two keys, negligible cost) so callers may add to it and no
+    bearer token outlives the connection that issued it.
+    """
+    return {
         "Authorization": f"Bearer {sf_connection.session_id}",
         "Accept": "application/json",
     }
+
+
+def _metadata_base(sf_connection) -> str:
+    """Return the REST Metadata deployRequest base URL (with trailing slash)."""
+    return f"{sf_connection.base_url}metadata/deployRequest/"
+
+
+def _execute_metadata_rest_deploy_multipart(
+    sf_connection, zip_buffer: IO[bytes], check_only: bool = False
+) -> Dict[str, Any]:
+    """Submit a deployment via the REST Metadata endpoint."""
+    endpoint = _metadata_base(sf_connection).rstrip("/")
+    headers = _auth_headers(sf_connection)
     deploy_opts = {
         "checkOnly": check_only,
         "testLevel": "NoTestRun",
         "singlePackage": True,
         "rollbackOnError": True,
     }
-    json_part = json.dumps({"deployOptions": deploy_opts})
+    json_part = dumps_json({"deployOptions": deploy_opts}, pretty=False)
     files = {
         "entity_content": (None, json_part, "application/json"),
-        "file": ("deploymentPackage.zip", zip_buffer.getvalue(), "application/zip"),
+        "file": ("deploymentPackage.zip", zip_buffer, "application/zip"),
     }
 
-    resp = requests.post(endpoint, headers=headers, files=files, timeout=120)
+    # Shared keep-alive session: the deploy and its status polls reuse one TLS connection
+    resp = get_http_session().post(endpoint, headers=headers, files=files, timeout=120)
     resp.raise_for_status()
     data = resp.json()
     if not data.get("id"):
@@ -247,44 +382,495 @@ def _execute_metadata_rest_deploy_multipart(
     return data
 
 
+# First poll delay; doubles each round up to the caller's interval_seconds
+_POLL_BASE_DELAY = 0.2
+
+
 def _poll_metadata_rest_deploy_status(
     sf_connection,
     async_process_id: str,
     timeout_seconds: int = 300,
     interval_seconds: int = 5,
+    details_on_success: bool = True,
 ) -> Dict[str, Any]:
-    """Poll deployRequest/{id} until done or timeout."""
-    endpoint = f"{sf_connection.base_url}metadata/deployRequest/{async_process_id}"
-    headers = {
-        "Authorization": f"Bearer {sf_connection.session_id}",
-        "Accept": "application/json",
-    }
+    """Poll deployRequest/{id} until done or timeout.
+
+    Polls back off exponentially from `_POLL_BASE_DELAY` to `interval_seconds`
+    (with jitter), so quick deploys are seen almost immediately while long
+    ones cost few requests.
 
-    start = time.time()
+    Polling requests the lightweight summary (includeDetails=false); the
+    component-level details are fetched once, after the deploy is done.
+    Callers that only look at `details` on failure pass
+    `details_on_success=False` to skip that fetch for successful deploys.
+    """
+    endpoint = f"{_metadata_base(sf_connection)}{async_process_id}"
+    summary_url = f"{endpoint}?includeDetails=false"
+    details_url = f"{endpoint}?includeDetails=true"
+    headers = _auth_headers(sf_connection)
+    # Pooled keep-alive session: every poll reuses the same TLS connection
+    http = get_http_session()
+
+    deadline = time.monotonic() + timeout_seconds
+    attempt = 0
     while True:
-        if time.time() - start > timeout_seconds:
+        if time.monotonic() > deadline:
             return {"success": False, "status": "Timeout"}
 
-        resp = requests.get(endpoint, headers=headers, timeout=45)
+        resp = http.get(summary_url, headers=headers, timeout=45)
         resp.raise_for_status()
         result = resp.json().get("deployResult", {})
         if result.get("done"):
+            if result.get("status") == "Succeeded" and not details_on_success:
+                return {"success": True, "status": "Succeeded", "details": None}
+            # One detailed fetch on completion to surface component results/errors
+            detail_resp = http.get(details_url, headers=headers, timeout=45)
+            detail_resp.raise_for_status()
+            final = detail_resp.json().get("deployResult", result)
             return {
-                "success": result["status"] in {"Succeeded", "SucceededPartial"},
-                "status": result["status"],
-                "details": result.get("details"),
+                "success": final["status"] in {"Succeeded", "SucceededPartial"},
+                "status": final["status"],
+                "details": final.get("details"),
             }
 
         logger.info(
             "Deployment %s status: %s (%s/%s components)",
             async_process_id,
             result.get("status"),
-            result.get("details", {}).get("numberComponentsDeployed", 0),
-            result.get("details", {}).get("numberComponentsTotal", 0),
+            result.get("numberComponentsDeployed", 0),
+            result.get("numberComponentsTotal", 0),
         )
-        time.sleep(interval_seconds)
+        delay = min(interval_seconds, _POLL_BASE_DELAY * 2 ** attempt) * random.uniform(0.9, 1.1)
+        attempt += 1
+        time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+
 
 
+# =============================================================================
+# INTERNAL HELPERS – DESCRIBE CACHE
+# =============================================================================
+
+# describe() payloads are effectively static within an org session; keep them
+# for 30 minutes, keyed per (instance, session) so users with different
+# permissions on the same org never see each other's describe. Only successful describes are cached, so a newly created
+# object is visible immediately.
+_describe_cache = TTLCache(maxsize=512, ttl=1800)
+# Derived {field API name: describe field} index per object, for O(1) lookups.
+_field_index_cache = TTLCache(maxsize=512, ttl=1800)
+# fetch_object_metadata's projected field list, same key/lifetime as the describe
+_projected_fields_cache = TTLCache(maxsize=512, ttl=1800)
+
+
+def _session_key(sf_connection) -> Tuple[Optional[str], Optional[str]]:
+    return (getattr(sf_connection, "sf_instance", None), getattr(sf_connection, "session_id", None))
+
+
+def _describe_cache_key(sf_connection, object_name: str) -> Tuple[Optional[str], Optional[str], str]:
+    return _session_key(sf_connection) + (object_name,)
+
+
+def _index_fields(desc: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    return {f["name"]: f for f in desc["fields"]}
+
+
+def _describe_sobject(sf_connection, object_name: str) -> Dict[str, Any]:
+    """Return `describe()` for an sObject, served from the process-wide TTL cache.
+
+    The returned dict is shared — callers must not mutate it.
+    """
+    key = _describe_cache_key(sf_connection, object_name)
+    desc = _describe_cache.get(key)
+    if desc is None:
+        desc = getattr(sf_connection, object_name).describe()
+        _describe_cache.set(key, desc)
+        # Build the index while the payload is hot so both expire together
+        _field_index_cache.set(key, _index_fields(desc))
+    return desc
+
+
+def _sobject_field_index(sf_connection, object_name: str) -> Dict[str, Dict[str, Any]]:
+    """Return {field API name: describe field} for the object (cached, shared).
+
+    Raises if the object is missing. Callers must not mutate the field dicts.
+    """
+    key = _describe_cache_key(sf_connection, object_name)
+    index = _field_index_cache.get(key)
+    if index is None:
+        index = _index_fields(_describe_sobject(sf_connection, object_name))
+        _field_index_cache.set(key, index)
+    return index
+
+
+def _field_exists(sf_connection, object_name: str, field_name: str) -> bool:
+    """True if the field exists on the object.
+
+    Answers from the cached field index when the object has been described;
+    otherwise runs a one-row FieldDefinition query instead of pulling the
+    whole describe payload for a single name.
+    """
+    index = _field_index_cache.get(_describe_cache_key(sf_connection, object_name))
+    if index is not None:
+        return field_name in index
+    res = _tooling_query(
+        sf_connection,
+        "SELECT QualifiedApiName FROM FieldDefinition "
+        f"WHERE EntityDefinition.QualifiedApiName = {_soql_quote(object_name)} "
+        f"AND QualifiedApiName = {_soql_quote(field_name)} LIMIT 1",
+    )
+    return bool(res.get("records"))
+
+
+# Lower-cased sObject names from describeGlobal, per (instance, session). The object list
+# changes rarely; upsert_custom_object drops the entry after a deploy, and a
+# miss re-reads it (see _object_exists).
+_global_sobjects_cache = TTLCache(maxsize=32, ttl=3600)
+
+
+def _global_sobject_names(sf_connection, refresh: bool = False) -> frozenset:
+    key = _session_key(sf_connection)
+    names = None if refresh else _global_sobjects_cache.get(key)
+    if names is None:
+        names = frozenset(o["name"].lower() for o in sf_connection.describe()["sobjects"])
+        _global_sobjects_cache.set(key, names)
+    return names
+
+
+def _object_exists(sf_connection, object_name: str) -> bool:
+    """True if `object_name` is in this org's describeGlobal list.
+
+    Hits are answered from the cached list. A miss re-fetches describeGlobal
+    once before returning False, so objects created since the list was cached
+    (in the org or by another tool) are found; only positive answers are
+    effectively cached.
+    """
+    if not object_name:
+        return False
+    name = object_name.lower()
+    return (
+        name in _global_sobject_names(sf_connection)
+        or name in _global_sobject_names(sf_connection, refresh=True)
+    )
+
+
+def _projected_fields(sf_connection, object_name: str, desc: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """fetch_object_metadata's field summaries, projected once per describe (cached, shared)."""
+    key = _describe_cache_key(sf_connection, object_name)
+    fields = _projected_fields_cache.get(key)
+    if fields is None:
+        fields = [_project_field(f) for f in desc["fields"]]
+        _projected_fields_cache.set(key, fields)
+    return fields
+
+
+_DESCRIBE_BATCH = 25  # composite/batch sub-request limit
+
+
+def _describe_many(sf_connection, object_names: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Describe several sObjects; return {name: describe or None if not found}.
+
+    Cached describes are reused; the rest go out through the REST composite
+    batch endpoint, `_DESCRIBE_BATCH` describes per HTTP request, and are
+    stored in the describe cache.
+    """
+    out: Dict[str, Optional[Dict[str, Any]]] = {}
+    missing: List[str] = []
+    for name in object_names:
+        desc = _describe_cache.get(_describe_cache_key(sf_connection, name))
+        if desc is None:
+            missing.append(name)
+        else:
+            out[name] = desc
+
+    version = f"v{_connection_api_version(sf_connection)}"
+    for start in range(0, len(missing), _DESCRIBE_BATCH):
+        batch = missing[start:start + _DESCRIBE_BATCH]
+        res = sf_connection.restful("composite/batch", method="POST", json={
+            "batchRequests": [
+                {"method": "GET", "url": f"{version}/sobjects/{name}/describe"} for name in batch
+            ]
+        })
+        for name, sub in zip(batch, res.get("results", [])):
+            if sub.get("statusCode", 500) >= 400:
+                out[name] = None
+                continue
+            desc = sub["result"]
+            key = _describe_cache_key(sf_connection, name)
+            _describe_cache.set(key, desc)
+            _field_index_cache.set(key, _index_fields(desc))
+            out[name] = desc
+
+    return {name: out.get(name) for name in object_names}
+
+
+def _invalidate_describe(sf_connection, object_name: str) -> None:
+    """Drop a cached describe after a deploy changes the object's schema."""
+    key = _describe_cache_key(sf_connection, object_name)
+    _describe_cache.pop(key)
+    _field_index_cache.pop(key)
+    _projected_fields_cache.pop(key)
+
+
+# Recent ValidationRule existence answers keyed by (instance, object, rule).
+# Kept short because rules can be created or deleted outside this server;
+# successful deploys from this module record the rule as existing.
+_vr_exists = TTLCache(maxsize=1024, ttl=60)
+
+
+# Shared pool for running independent, I/O-bound preflight lookups side by side.
+_preflight_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="sf-preflight")
+
+# ValidationRule Tooling queries; fill with _soql_quote()d values via .format()
+_VR_WHERE = "WHERE Name = {name} AND EntityDefinition.QualifiedApiName = {obj} LIMIT 1"
+_VR_EXISTS_Q = "SELECT Id FROM ValidationRule " + _VR_WHERE
+_VR_STATE_Q = (
+    "SELECT Id, Active, ErrorConditionFormula, ErrorDisplayField, ErrorMessage, Description "
+    "FROM ValidationRule " + _VR_WHERE
+)
+_VR_DETAIL_COLS = (
+    "SELECT Id, Name, Active, ErrorConditionFormula, ErrorDisplayField, ErrorMessage, "
+    "Description, CreatedDate, CreatedById, CreatedBy.Name, LastModifiedDate, "
+    "LastModifiedById, LastModifiedBy.Name, NamespacePrefix FROM ValidationRule "
+)
+_VR_DETAIL_Q = _VR_DETAIL_COLS + _VR_WHERE
+_VR_DETAIL_IN_Q = _VR_DETAIL_COLS + "WHERE Name IN ({names}) AND EntityDefinition.QualifiedApiName = {obj}"
+
+
+def _validation_rule_exists(sf_connection, object_name: str, rule_name: str) -> bool:
+    key = (getattr(sf_connection, "sf_instance", None), object_name, rule_name)
+    exists = _vr_exists.get(key)
+    if exists is None:
+        check_query = _VR_EXISTS_Q.format(name=_soql_quote(rule_name), obj=_soql_quote(object_name))
+        exists = _tooling_query(sf_connection, check_query).get("size", 0) > 0
+        _vr_exists.set(key, exists)
+    return exists
+
+
+def _fetch_validation_rule_state(sf_connection, object_name: str, rule_name: str) -> Optional[Dict[str, Any]]:
+    """Return the rule's current deployable values, or None if it does not exist."""
+    res = _tooling_query(
+        sf_connection,
+        _VR_STATE_Q.format(name=_soql_quote(rule_name), obj=_soql_quote(object_name)),
+    )
+    records = res.get("records") or []
+    _vr_exists.set((getattr(sf_connection, "sf_instance", None), object_name, rule_name), bool(records))
+    return records[0] if records else None
+
+
+_WS_RE = re.compile(r"\s+")
+
+
+def _norm_ws(value: Optional[str]) -> str:
+    """Collapse whitespace runs and trim; None becomes ''."""
+    return _WS_RE.sub(" ", value).strip() if value else ""
+
+
+def _norm_eol(value: Optional[str]) -> str:
+    """Normalize CRLF/CR line endings to LF; None becomes ''."""
+    return value.replace("\r\n", "\n").replace("\r", "\n") if value else ""
+
+
+def _validation_rule_unchanged(
+    current: Dict[str, Any], error_condition_formula: str, error_message: str,
+    error_display_field: str, description: str, active: bool
+) -> bool:
+    """True if deploying these values would not change the live rule.
+
+    Text must match exactly apart from line-ending style; any other whitespace
+    edit (e.g. inside a formula string literal) is a real change.
+    """
+    return (
+        _norm_eol(current.get("ErrorConditionFormula")) == _norm_eol(error_condition_formula)
+        and _norm_eol(current.get("ErrorMessage")) == _norm_eol(error_message)
+        and (current.get("ErrorDisplayField") or "") == (error_display_field or "")
+        and _norm_eol(current.get("Description")) == _norm_eol(description)
+        and bool(current.get("Active")) == bool(active)
+    )
+
+
+def _mark_validation_rule_exists(sf_connection, object_name: str, rule_name: str) -> None:
+    _vr_exists.set((getattr(sf_connection, "sf_instance", None), object_name, rule_name), True)
+
+
+# Highest API version each org supports, looked up once per instance. It only
+# changes with a Salesforce release, so process lifetime is fine.
+_org_api_versions: Dict[Optional[str], str] = {}
+
+
+def _get_org_api_version(sf_connection) -> str:
+    """Return the org's latest API version (memoized), or the default on failure."""
+    instance = getattr(sf_connection, "sf_instance", None)
+    version = _org_api_versions.get(instance)
+    if version is None:
+        try:
+            resp = sf_connection.session.get(f"https://{instance}/services/data/", timeout=30)
+            resp.raise_for_status()
+            version = max((v["version"] for v in resp.json()), key=float)
+        except Exception as e:
+            logger.warning("Could not read org API versions, using %s: %r", _DEFAULT_API_VERSION, e)
+            return _DEFAULT_API_VERSION
+        _org_api_versions[instance] = version
+    return version
+
+
+# Stale-while-revalidate cache for fetch_apex_trigger: entries hold
+# (response_json, LastModifiedDate). A hit is served immediately while a
+# background `SELECT LastModifiedDate` probe drops the entry if the trigger
+# changed. In-flight coalescing means simultaneous identical misses hit
+# Salesforce once. Deploys through this module invalidate directly.
+_trigger_response_cache = TTLCache(maxsize=1024, ttl=60)
+_trigger_fetches = SingleFlight()
+_trigger_probe_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="trigger-swr")
+_trigger_probing: set = set()
+_trigger_probe_lock = threading.Lock()
+
+
+def _trigger_cache_key(sf_connection, trigger_name: str) -> Tuple[Optional[str], str]:
+    return (getattr(sf_connection, "sf_instance", None), trigger_name)
+
+
+def _invalidate_trigger(sf_connection, trigger_name: str) -> None:
+    base = _trigger_cache_key(sf_connection, trigger_name)
+    for select in (*_TRIGGER_SELECT.values(), _TRIGGER_SYMBOLS_SELECT):
+        _trigger_response_cache.pop((*base, select))
+
+
+def _revalidate_trigger(sf_connection, trigger_name: str, key: Tuple, last_modified: Optional[str]) -> None:
+    """Schedule a cheap LastModifiedDate probe for a cached trigger (at most one per key)."""
+    with _trigger_probe_lock:
+        if key in _trigger_probing:
+            return
+        _trigger_probing.add(key)
+
+    def _probe() -> None:
+        try:
+            res = _tooling_query(
+                sf_connection,
+                f"SELECT LastModifiedDate FROM ApexTrigger WHERE Name = {_soql_quote(trigger_name)}",
+            )
+            records = res.get("records") or []
+            if not records or records[0].get("LastModifiedDate") != last_modified:
+                _trigger_response_cache.pop(key)
+        except Exception as e:
+            logger.debug("Trigger revalidation for %s failed: %r", trigger_name, e)
+            _trigger_response_cache.pop(key)
+        finally:
+            with _trigger_probe_lock:
+                _trigger_probing.discard(key)
+
+    _trigger_probe_pool.submit(_probe)
+
+
+_TRIGGER_META_COLS = (
+    "Id", "Name", "ApiVersion", "Status", "TableEnumOrId", "LengthWithoutComments",
+    "CreatedDate", "CreatedById", "LastModifiedDate", "LastModifiedById", "NamespacePrefix",
+)
+_TRIGGER_ACTOR_COLS = ("CreatedBy.Name", "LastModifiedBy.Name")
+
+# SELECT lists for fetch_apex_trigger, keyed by (include_body, include_actors)
+_TRIGGER_SELECT = {
+    (body, actors): ", ".join(
+        _TRIGGER_META_COLS + (("Body",) if body else ()) + (_TRIGGER_ACTOR_COLS if actors else ())
+    )
+    for body in (True, False)
+    for actors in (True, False)
+}
+_TRIGGER_SYMBOLS_SELECT = "Id, Name, TableEnumOrId, LengthWithoutComments, LastModifiedDate, SymbolTable"
+_TRIGGER_FETCH_MODES = ("full", "summary", "symbols")
+
+
+# =============================================================================
+# INTERNAL HELPERS – COMPOSITE QUERIES
+# =============================================================================
+
+def _composite_query(sf_connection, queries: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+    """Run several Tooling SOQL queries in a single composite round-trip.
+
+    `queries` maps a referenceId to its SOQL. Returns each sub-response body
+    keyed by referenceId; a failed sub-request raises.
+    """
+    base = f"/services/data/v{sf_connection.sf_version}/tooling/query/?q="
+    body = {
+        "allOrNone": False,
+        "compositeRequest": [
+            {"method": "GET", "url": base + quote_plus(soql), "referenceId": ref}
+            for ref, soql in queries.items()
+        ],
+    }
+    res = sf_connection.restful("tooling/composite", method="POST", json=body)
+
+    out: Dict[str, Dict[str, Any]] = {}
+    for sub in res.get("compositeResponse", []):
+        if sub.get("httpStatusCode", 500) >= 400:
+            raise Exception(f"Composite sub-request '{sub.get('referenceId')}' failed: {sub.get('body')}")
+        out[sub["referenceId"]] = sub.get("body") or {}
+    return out
+
+
+_COMPOSITE_MAX_SUBREQUESTS = 25
+
+
+def _verify_schema_batch(
+    sf_connection,
+    objects: Optional[List[str]] = None,
+    fields: Optional[List[str]] = None,
+    classes: Optional[List[str]] = None,
+) -> List[str]:
+    """Check that objects, `Object.Field` names and Apex classes exist.
+
+    All lookups go out as Tooling composite requests (one round-trip for up to
+    25 sub-queries) instead of one describe/query per name. Returns a list of
+    human-readable misses; empty means everything exists.
+    """
+    objects = sorted(set(objects or []))
+    classes = sorted(set(classes or []))
+    fields_by_object: Dict[str, set] = {}
+    for qualified in fields or []:
+        obj, _, fld = qualified.partition(".")
+        if not fld:
+            raise ValueError(f"Field reference '{qualified}' must be 'Object.Field'")
+        fields_by_object.setdefault(obj, set()).add(fld)
+
+    def _in(names) -> str:
+        return ", ".join(_soql_quote(n) for n in sorted(names))
+
+    queries: Dict[str, str] = {}
+    if objects:
+        queries["objects"] = (
+            f"SELECT QualifiedApiName FROM EntityDefinition WHERE QualifiedApiName IN ({_in(objects)})"
+        )
+    if classes:
+        queries["classes"] = f"SELECT Name FROM ApexClass WHERE Name IN ({_in(classes)})"
+    field_refs: Dict[str, str] = {}
+    for i, (obj, flds) in enumerate(sorted(fields_by_object.items())):
+        ref = f"fields{i}"
+        field_refs[ref] = obj
+        queries[ref] = (
+            "SELECT QualifiedApiName FROM FieldDefinition "
+            f"WHERE EntityDefinition.QualifiedApiName = {_soql_quote(obj)} "
+            f"AND QualifiedApiName IN ({_in(flds)})"
+        )
+
+    results: Dict[str, Dict[str, Any]] = {}
+    items = list(queries.items())
+    for i in range(0, len(items), _COMPOSITE_MAX_SUBREQUESTS):
+        results.update(_composite_query(sf_connection, dict(items[i:i + _COMPOSITE_MAX_SUBREQUESTS])))
+
+    def _found(ref: str, column: str) -> set:
+        # SOQL IN matches case-insensitively, so compare lower-cased names
+        return {(r.get(column) or "").lower() for r in results.get(ref, {}).get("records", [])}
+
+    missing: List[str] = []
+    if objects:
+        found = _found("objects", "QualifiedApiName")
+        missing += [f"Object '{o}' not found" for o in objects if o.lower() not in found]
+    for ref, obj in field_refs.items():
+        found = _found(ref, "QualifiedApiName")
+        missing += [f"Field '{obj}.{f}' not found" for f in sorted(fields_by_object[obj]) if f.lower() not in found]
+    if classes:
+        found = _found("classes", "Name")
+        missing += [f"Apex class '{c}' not found" for c in classes if c.lower() not in found]
+    return missing
+
 
 @register_tool
 def get_metadata_deploy_status(job_id: str, include_details: bool = True) -> str:
@@ -294,19 +880,18 @@ def get_metadata_deploy_status(job_id: str, include_details: bool = True) -> str
     try:
         sf = get_salesforce_connection()
         q = "?includeDetails=true" if include_details else ""
-        endpoint = f"{sf.base_url}metadata/deployRequest/{job_id}{q}"
-        headers = {"Authorization": f"Bearer {sf.session_id}", "Accept": "application/json"}
-        r = requests.get(endpoint, headers=headers, timeout=45)
+        endpoint = f"{_metadata_base(sf)}{job_id}{q}"
+        r = get_http_session().get(endpoint, headers=_auth_headers(sf), timeout=45)
         r.raise_for_status()
         payload = r.json()
         result = payload.get("deployResult", payload)
-        return json.dumps({
+        return dumps_json({
             "success": result.get("status") in {"Succeeded", "SucceededPartial"},
             "status": result.get("status"),
             "details": result.get("details")
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({"success": False, "error": str(e), "job_id": job_id}, indent=2)
+        return dumps_json({"success": False, "error": str(e), "job_id": job_id})
 
 
 # =============================================================================
@@ -387,7 +972,7 @@ Examples:
         )
         tooling_res = sf.toolingexecute(f"query/?q={tooling_q}")
         if tooling_res.get("size") == 0:
-            return json.dumps({"success": False, "error": f"{class_name} not found"}, indent=2)
+            return dumps_json({"success": False, "error": f"{class_name} not found"})
         apex = tooling_res["records"][0]
 
         # add CreatedBy / LastModifiedBy names
@@ -398,17 +983,17 @@ Examples:
         core_res = sf.query(core_q)
         if core_res.get("records"):
             extra = core_res["records"][0]
-            apex["CreatedByName"] = extra["CreatedBy"]["Name"]
-            apex["LastModifiedByName"] = extra["LastModifiedBy"]["Name"]
+            apex["CreatedByName"] = _nested(extra, "CreatedBy", "Name")
+            apex["LastModifiedByName"] = _nested(extra, "LastModifiedBy", "Name")
             apex["NamespacePrefix"] = extra["NamespacePrefix"]
 
         apex.pop("attributes", None)
 
-        return json.dumps({"success": True, "data": apex}, indent=2)
+        return dumps_json({"success": True, "data": apex})
 
     except Exception as e:
         logger.error("fetch_apex_class: %s", e, exc_info=True)
-        return json.dumps({"success": False, "error": str(e)}, indent=2)
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -523,34 +1108,32 @@ res = json.loads(create_apex_class("InvoiceService", body, 59.0))
 assert res["success"], res
 """
 
+    # Validate class name (before any network call)
+    if not _NAME_RE.match(class_name or ""):
+        return dumps_json(
+            {"success": False, "error": "Invalid class name. Use only alphanumeric characters and underscores."},
+        )
+
     try:
         sf = get_salesforce_connection()
         
         # Check if class already exists
-        check = sf.query(f"SELECT Id FROM ApexClass WHERE Name = '{class_name}'")
+        check = sf.query(f"SELECT Id FROM ApexClass WHERE Name = {_soql_quote(class_name)}")
         if check["totalSize"] > 0:
-            return json.dumps(
+            return dumps_json(
                 {
                     "success": False,
                     "error": f"Apex class '{class_name}' already exists. Use upsert_apex_class to update it.",
                 },
-                indent=2,
-            )
-
-        # Validate class name
-        if not class_name.replace("_", "").isalnum():
-            return json.dumps(
-                {"success": False, "error": "Invalid class name. Use only alphanumeric characters and underscores."},
-                indent=2,
             )
 
         if api_version is None:
-            api_version = "59.0"
+            api_version = _get_org_api_version(sf)
 
         files = {"apex": body}
         res = deploy_apex_class_internal(sf, class_name, files, str(api_version))
         
-        return json.dumps({
+        return dumps_json({
             "success": res.get("success", False),
             "operation": "create_apex_class",
             "class_name": class_name,
@@ -558,11 +1141,11 @@ assert res["success"], res
             "message": f"Successfully created Apex class '{class_name}'" if res.get("success") else f"Failed to create Apex class '{class_name}'",
             "job_id": res.get("job_id"),
             "errors": res.get("details") if not res.get("success") else None
-        }, indent=2)
+        })
 
     except Exception as e:
         logger.error("create_apex_class: %s", e, exc_info=True)
-        return json.dumps({"success": False, "error": str(e)}, indent=2)
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -686,12 +1269,11 @@ Implementation notes:
         sf = get_salesforce_connection()
         check = sf.query(f"SELECT Id, ApiVersion FROM ApexClass WHERE Name = '{class_name}'")
         if check["totalSize"] == 0:
-            return json.dumps(
+            return dumps_json(
                 {
                     "success": False,
                     "error": f"{class_name} not found (use create_apex_class to create new classes)",
                 },
-                indent=2,
             )
 
         if api_version is None:
@@ -700,7 +1282,7 @@ Implementation notes:
         files = {"apex": body}
         res = deploy_apex_class_internal(sf, class_name, files, str(api_version))
         
-        return json.dumps({
+        return dumps_json({
             "success": res.get("success", False),
             "operation": "update_apex_class",
             "class_name": class_name,
@@ -708,11 +1290,11 @@ Implementation notes:
             "message": f"Successfully updated Apex class '{class_name}'" if res.get("success") else f"Failed to update Apex class '{class_name}'",
             "job_id": res.get("job_id"),
             "errors": res.get("details") if not res.get("success") else None
-        }, indent=2)
+        })
 
     except Exception as e:
         logger.error("upsert_apex_class: %s", e, exc_info=True)
-        return json.dumps({"success": False, "error": str(e)}, indent=2)
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # =============================================================================
@@ -721,30 +1303,43 @@ Implementation notes:
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
 # @register_tool
-def fetch_apex_trigger(trigger_name: str) -> str:
+def fetch_apex_trigger(
+    trigger_name: str, include_body: bool = True, include_actors: Optional[bool] = None, mode: str = "full"
+) -> str:
     """Fetch a single **ApexTrigger** record (body + metadata) by Name, combining
 Tooling and Core API fields into one normalized payload.
 
 What it does:
-- Runs a Tooling SOQL to retrieve the trigger **Body**, `ApiVersion`, `Status`,
-  `TableEnumOrId`, `LengthWithoutComments`, timestamps, and actor IDs.
-- Enriches with Core API fields for human-friendly names:
-  `CreatedBy.Name`, `LastModifiedBy.Name`, and `NamespacePrefix`.
+- Runs a single Tooling SOQL to retrieve the trigger **Body**, `ApiVersion`, `Status`,
+  `TableEnumOrId`, `LengthWithoutComments`, timestamps, and actor IDs, plus the
+  human-friendly `CreatedBy.Name`, `LastModifiedBy.Name`, and `NamespacePrefix`
+  (flattened into `CreatedByName` / `LastModifiedByName`).
 - Strips Salesforce `attributes` for a cleaner result.
 - Returns a JSON string with `"success": true` and a `data` object on success.
 
 Notes & caveats:
 - **Uniqueness**: `ApexTrigger.Name` is unique per namespace; this function expects
   at most one match and returns the first (uses implicit LIMIT via single record).
-- **Quoting**: The SOQL interpolates `trigger_name`. Prefer a helper like
-  `soql_quote()` to avoid malformed queries when adapting this function.
+- **Quoting**: `trigger_name` is validated up front and bound into the SOQL via
+  `_soql_quote()`; the query text is URL-encoded as a request parameter.
 - **Read-only**: No updates or deploys are performed here. Use
   `create_apex_trigger(...)` or `upsert_apex_trigger(...)` for changes.
+- **Caching**: Results are cached for up to 60s. A cache hit is returned at once
+  and revalidated in the background against `LastModifiedDate`, so an edit made
+  outside this server shows up on the next call after the probe.
 - **Dependencies**: This function does not validate any referenced objects,
   fields, or classes within the Body—fetch/verify those separately if needed.
 
 Args:
     trigger_name (str): Exact Apex trigger `Name` (DeveloperName), e.g., "AccountTrigger".
+    include_body (bool): Select `Body`. Pass False when only metadata is needed
+                         (listing/diffing); large triggers then move far fewer bytes.
+    include_actors (bool): Select the `CreatedBy.Name` / `LastModifiedBy.Name` joins.
+                           Defaults to True in "full" mode and False in "summary" mode.
+    mode (str): "full" (default) honours the flags above; "summary" never selects
+                `Body` and skips the actor joins unless `include_actors=True`;
+                "symbols" returns only `Id`, `Name`, `TableEnumOrId`,
+                `LengthWithoutComments`, `LastModifiedDate` and the compiled `SymbolTable`.
 
 Returns:
     str: JSON-encoded string.
@@ -785,38 +1380,55 @@ Examples:
         table = res["data"]["TableEnumOrId"]
 """
 
+    if not _NAME_RE.match(trigger_name or ""):
+        return _ERR_INVALID_TRIGGER_NAME
+    if mode not in _TRIGGER_FETCH_MODES:
+        return dumps_json(
+            {"success": False, "error": f"Invalid mode '{mode}'. Use one of: {', '.join(_TRIGGER_FETCH_MODES)}"}
+        )
+    if include_actors is None:
+        include_actors = mode == "full"
+    if mode == "symbols":
+        select, include_actors = _TRIGGER_SYMBOLS_SELECT, False
+    else:
+        select = _TRIGGER_SELECT[include_body and mode == "full", include_actors]
+
     try:
         sf = get_salesforce_connection()
+        key = (*_trigger_cache_key(sf, trigger_name), select)
+        cached = _trigger_response_cache.get(key)
+        if cached is not None:
+            result, last_modified = cached
+            _revalidate_trigger(sf, trigger_name, key, last_modified)
+            return result
+
+        def _load() -> str:
+            tooling_q = (
+                f"SELECT {select} "
+                f"FROM ApexTrigger WHERE Name = {_soql_quote(trigger_name)}"
+            )
+            tooling_res = _tooling_query(sf, tooling_q)
+            if not tooling_res.get("records"):
+                return _ERR_TRIGGER_NOT_FOUND_FMT % trigger_name
+            trigger = tooling_res["records"][0]
 
-        tooling_q = (
-            "SELECT Id, Name, Body, ApiVersion, Status, TableEnumOrId, LengthWithoutComments, "
-            "CreatedDate, CreatedById, LastModifiedDate, LastModifiedById "
-            f"FROM ApexTrigger WHERE Name = '{trigger_name}'"
-        )
-        tooling_res = sf.toolingexecute(f"query/?q={tooling_q}")
-        if tooling_res.get("size") == 0:
-            return json.dumps({"success": False, "error": f"{trigger_name} not found"}, indent=2)
-        trigger = tooling_res["records"][0]
+            if include_actors:
+                # flatten CreatedBy / LastModifiedBy names
+                trigger["CreatedByName"] = _nested(trigger.pop("CreatedBy", None), "Name")
+                trigger["LastModifiedByName"] = _nested(trigger.pop("LastModifiedBy", None), "Name")
 
-        # add CreatedBy / LastModifiedBy names
-        core_q = (
-            "SELECT Id, NamespacePrefix, CreatedBy.Name, LastModifiedBy.Name "
-            f"FROM ApexTrigger WHERE Name = '{trigger_name}'"
-        )
-        core_res = sf.query(core_q)
-        if core_res.get("records"):
-            extra = core_res["records"][0]
-            trigger["CreatedByName"] = extra["CreatedBy"]["Name"]
-            trigger["LastModifiedByName"] = extra["LastModifiedBy"]["Name"]
-            trigger["NamespacePrefix"] = extra["NamespacePrefix"]
+            trigger.pop("attributes", None)
 
-        trigger.pop("attributes", None)
+            result = dumps_json({"success": True, "data": trigger})
+            _trigger_response_cache.set(key, (result, trigger.get("LastModifiedDate")))
+            return result
 
-        return json.dumps({"success": True, "data": trigger}, indent=2)
+        # Concurrent fetches of the same trigger share one round-trip
+        return _trigger_fetches.do(key, _load)
 
     except Exception as e:
-        logger.error("fetch_apex_trigger: %s", e, exc_info=True)
-        return json.dumps({"success": False, "error": str(e)}, indent=2)
+        logger.error("fetch_apex_trigger failed: %r", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -826,7 +1438,10 @@ def create_apex_trigger(
     body: str, 
     table_name: str, 
     api_version: Optional[float] = None, 
-    description: str = ""
+    description: str = "",
+    required_objects: Optional[List[str]] = None,
+    required_fields: Optional[List[str]] = None,
+    required_classes: Optional[List[str]] = None,
 ) -> str:
     """Create a **new Apex trigger** with strict preflight checks and name-uniqueness
 enforcement.
@@ -841,7 +1456,7 @@ Built-in safeguards:
   empty. (Best practice: start with a letter; avoid double underscores.)
 - **Table validation**: Verifies the target object exists via describe.
 - **API version**: Uses the provided `api_version`; otherwise defaults to the
-  org's version if available (or `"59.0"` as a fallback).
+  org's latest version (looked up once per process; `"59.0"` as a fallback).
 
 Preflight checklist (caller responsibility — "no hypothetical names"):
 1) **Do not invent schema or class names**  
@@ -878,6 +1493,11 @@ Args:
                     to the org's version when available, else "59.0".
     description (str): (Reserved for future use by your internals; not persisted by
                        this deploy helper unless your implementation uses it.)
+    required_objects (Optional[List[str]]): sObjects the body references, e.g. ["Invoice__c"].
+    required_fields (Optional[List[str]]): Fields as "Object.Field", e.g. ["Invoice__c.Customer_Code__c"].
+    required_classes (Optional[List[str]]): Apex classes the body calls.
+                    All three are verified in one composite round-trip before
+                    deploying; any miss fails with `details` listing them.
 
 Returns:
     str: JSON-encoded string.
@@ -939,43 +1559,38 @@ res = json.loads(create_apex_trigger("AccountTrigger", body, "Account", 59.0))
 assert res["success"], res
 """
 
+    # Validate trigger name (before any network call)
+    if not _NAME_RE.match(trigger_name or ""):
+        return _ERR_INVALID_TRIGGER_NAME
+
     try:
         sf = get_salesforce_connection()
-        
+
         # Check if trigger already exists
-        check = sf.query(f"SELECT Id FROM ApexTrigger WHERE Name = '{trigger_name}'")
+        check = sf.query(f"SELECT Id FROM ApexTrigger WHERE Name = {_soql_quote(trigger_name)}")
         if check["totalSize"] > 0:
-            return json.dumps(
-                {
-                    "success": False,
-                    "error": f"Apex trigger '{trigger_name}' already exists. Use upsert_apex_trigger to update it.",
-                },
-                indent=2,
-            )
-
-        # Validate trigger name
-        if not trigger_name.replace("_", "").isalnum():
-            return json.dumps(
-                {"success": False, "error": "Invalid trigger name. Use only alphanumeric characters and underscores."},
-                indent=2,
-            )
+            return _ERR_TRIGGER_EXISTS_FMT % trigger_name
 
         # Validate table exists
-        try:
-            getattr(sf, table_name).describe()
-        except Exception:
-            return json.dumps(
-                {"success": False, "error": f"Target object '{table_name}' not found"},
-                indent=2,
+        if not _object_exists(sf, table_name):
+            return dumps_json(
+                {"success": False, "error": f"Target object '{table_name}' not found"}
             )
 
+        if required_objects or required_fields or required_classes:
+            missing = _verify_schema_batch(sf, required_objects, required_fields, required_classes)
+            if missing:
+                return dumps_json(
+                    {"success": False, "error": "Schema reference check failed", "details": missing}
+                )
+
         if api_version is None:
-            api_version = "59.0"
+            api_version = _get_org_api_version(sf)
 
         files = {"apex": body}
         res = deploy_apex_trigger_internal(sf, trigger_name, table_name, files, str(api_version))
         
-        return json.dumps({
+        return dumps_json({
             "success": res.get("success", False),
             "operation": "create_apex_trigger",
             "trigger_name": trigger_name,
@@ -984,11 +1599,11 @@ assert res["success"], res
             "message": f"Successfully created Apex trigger '{trigger_name}'" if res.get("success") else f"Failed to create Apex trigger '{trigger_name}'",
             "job_id": res.get("job_id"),
             "errors": res.get("details") if not res.get("success") else None
-        }, indent=2)
+        })
 
     except Exception as e:
-        logger.error("create_apex_trigger: %s", e, exc_info=True)
-        return json.dumps({"success": False, "error": str(e)}, indent=2)
+        logger.error("create_apex_trigger failed: %r", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -997,7 +1612,10 @@ def upsert_apex_trigger(
     trigger_name: str, 
     body: str, 
     table_name: str, 
-    api_version: Optional[float] = None
+    api_version: Optional[float] = None,
+    required_objects: Optional[List[str]] = None,
+    required_fields: Optional[List[str]] = None,
+    required_classes: Optional[List[str]] = None,
 ) -> str:
     """Update an existing **Apex trigger** with a context-first, schema-safe workflow.
 
@@ -1052,6 +1670,11 @@ Args:
     body (str):       Full Apex trigger source to deploy.
     table_name (str): Target sObject API name (e.g., "Account", "Invoice__c").
     api_version (Optional[float]): Target API version. If None, keeps current.
+    required_objects (Optional[List[str]]): sObjects the body references, e.g. ["Invoice__c"].
+    required_fields (Optional[List[str]]): Fields as "Object.Field", e.g. ["Invoice__c.Customer_Code__c"].
+    required_classes (Optional[List[str]]): Apex classes the body calls.
+                    All three are verified in one composite round-trip before
+                    deploying; any miss fails with `details` listing them.
 
 Returns:
     str: JSON-encoded string.
@@ -1115,29 +1738,62 @@ Implementation notes:
   - regex-scans SOQL strings for object/field tokens, and
   - calls `fetch_object_metadata` / `fetch_custom_field` for each token.
 """
+    if not _NAME_RE.match(trigger_name or ""):
+        return _ERR_INVALID_TRIGGER_NAME
+
     try:
         sf = get_salesforce_connection()
-        check = sf.query(f"SELECT Id, ApiVersion, TableEnumOrId FROM ApexTrigger WHERE Name = '{trigger_name}'")
+        check = sf.query(
+            "SELECT Id, ApiVersion, TableEnumOrId, Body, Status FROM ApexTrigger "
+            f"WHERE Name = {_soql_quote(trigger_name)}"
+        )
         if check["totalSize"] == 0:
-            return json.dumps(
-                {
-                    "success": False,
-                    "error": f"{trigger_name} not found (use create_apex_trigger to create new triggers)",
-                },
-                indent=2,
-            )
+            return _ERR_TRIGGER_NOT_FOUND_UPSERT_FMT % trigger_name
 
+        current = check["records"][0]
         if api_version is None:
-            api_version = check["records"][0]["ApiVersion"]
-        
-        # Use the existing table name from the trigger, or the provided one
-        existing_table = check["records"][0]["TableEnumOrId"]
+            api_version = current["ApiVersion"]
+
+        # Use the existing table name from the trigger, or the provided one.
+        # The live trigger already proves its own table exists; only describe
+        # a different one.
+        existing_table = current["TableEnumOrId"]
         target_table = table_name if table_name else existing_table
+        if target_table != existing_table and not _object_exists(sf, target_table):
+            return dumps_json(
+                {"success": False, "error": f"Target object '{target_table}' not found"}
+            )
+
+        # Skip the (slow) metadata deploy when nothing would change; the
+        # deploy always writes Status=Active, so an inactive trigger still deploys
+        if (
+            current.get("Status") == "Active"
+            and float(api_version) == float(current["ApiVersion"])
+            and _body_digest(body) == _body_digest(current.get("Body") or "")
+        ):
+            return dumps_json({
+                "success": True,
+                "skipped": True,
+                "operation": "update_apex_trigger",
+                "trigger_name": trigger_name,
+                "table_name": target_table,
+                "api_version": api_version,
+                "message": f"Apex trigger '{trigger_name}' is already up to date; deploy skipped",
+                "job_id": None,
+                "errors": None
+            })
+
+        if required_objects or required_fields or required_classes:
+            missing = _verify_schema_batch(sf, required_objects, required_fields, required_classes)
+            if missing:
+                return dumps_json(
+                    {"success": False, "error": "Schema reference check failed", "details": missing}
+                )
 
         files = {"apex": body}
         res = deploy_apex_trigger_internal(sf, trigger_name, target_table, files, str(api_version))
         
-        return json.dumps({
+        return dumps_json({
             "success": res.get("success", False),
             "operation": "update_apex_trigger",
             "trigger_name": trigger_name,
@@ -1146,11 +1802,141 @@ Implementation notes:
             "message": f"Successfully updated Apex trigger '{trigger_name}'" if res.get("success") else f"Failed to update Apex trigger '{trigger_name}'",
             "job_id": res.get("job_id"),
             "errors": res.get("details") if not res.get("success") else None
-        }, indent=2)
+        })
+
+    except Exception as e:
+        logger.error("upsert_apex_trigger failed: %r", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+        return dumps_json({"success": False, "error": str(e)})
+
+
+@register_tool
+def upsert_apex_triggers_bulk(triggers: List[Dict[str, Any]]) -> str:
+    """Create or update several **Apex triggers** in one metadata deploy.
+
+Prefer this over repeated `deploy_metadata("ApexTrigger", ...)` calls when
+changing more than one trigger: all existence checks run as a single
+`Name IN (...)` query, each distinct target object is described once, and every
+trigger ships in one package with one deploy/poll cycle.
+
+Each item in `triggers`:
+    {
+      "name": "AccountTrigger",             # required
+      "body": "trigger AccountTrigger ...", # required, full source
+      "tableName": "Account",               # required for new triggers
+      "apiVersion": "59.0"                  # optional; existing triggers keep theirs,
+                                            # new ones default to the org's latest
+    }
+
+Existing active triggers whose body and API version are unchanged are reported as
+`skipped` and left out of the package. The deploy is all-or-nothing: if any
+trigger fails to compile, none are saved.
+
+Returns:
+    str: JSON-encoded string.
+
+    {
+      "success": true,
+      "operation": "upsert_apex_triggers_bulk",
+      "created": ["AccountTrigger"],
+      "updated": ["ContactTrigger"],
+      "skipped": ["LeadTrigger"],
+      "job_id": "<deploy-id>",
+      "message": "Deployed 2 Apex trigger(s)",
+      "errors": null
+    }
+"""
+    if not triggers:
+        return dumps_json({"success": False, "error": "No triggers provided"})
+
+    specs: Dict[str, Dict[str, Any]] = {}
+    seen = set()
+    for spec in triggers:
+        name = spec.get("name") or ""
+        if not _NAME_RE.match(name):
+            return dumps_json(
+                {"success": False, "error": f"Invalid trigger name '{name}'. Use only alphanumeric characters and underscores."}
+            )
+        if not spec.get("body"):
+            return dumps_json({"success": False, "error": f"Missing body for trigger '{name}'"})
+        if name.lower() in seen:
+            return dumps_json({"success": False, "error": f"Duplicate trigger name '{name}'"})
+        seen.add(name.lower())
+        specs[name] = spec
+
+    try:
+        sf = get_salesforce_connection()
+        names = ", ".join(_soql_quote(n) for n in specs)
+        live = sf.query_all(
+            f"SELECT Name, ApiVersion, TableEnumOrId, Body, Status FROM ApexTrigger WHERE Name IN ({names})"
+        )
+        # Trigger names are case-insensitive in Salesforce
+        existing = {r["Name"].lower(): r for r in live.get("records", [])}
+
+        # Describe each new target object once
+        new_tables = {
+            spec.get("tableName") or spec.get("objectName") or ""
+            for name, spec in specs.items() if name.lower() not in existing
+        }
+        for table in new_tables:
+            if not table:
+                return dumps_json(
+                    {"success": False, "error": "tableName is required for new triggers"}
+                )
+            if not _object_exists(sf, table):
+                return dumps_json(
+                    {"success": False, "error": f"Target object '{table}' not found"}
+                )
+
+        created: List[str] = []
+        updated: List[str] = []
+        skipped: List[str] = []
+        package: List[Tuple[str, str, str]] = []
+        for name, spec in specs.items():
+            body = spec["body"]
+            current = existing.get(name.lower())
+            if current is None:
+                package.append((name, body, str(spec.get("apiVersion") or _get_org_api_version(sf))))
+                created.append(name)
+                continue
+            api_version = spec.get("apiVersion") or current["ApiVersion"]
+            # The deploy always writes Status=Active, so an inactive trigger is not a no-op
+            if (
+                current.get("Status") == "Active"
+                and float(api_version) == float(current["ApiVersion"])
+                and _body_digest(body) == _body_digest(current.get("Body") or "")
+            ):
+                skipped.append(name)
+                continue
+            package.append((name, body, str(api_version)))
+            updated.append(name)
+
+        if not package:
+            return dumps_json({
+                "success": True,
+                "operation": "upsert_apex_triggers_bulk",
+                "created": [],
+                "updated": [],
+                "skipped": skipped,
+                "job_id": None,
+                "message": "All Apex triggers are already up to date; deploy skipped",
+                "errors": None
+            })
+
+        res = deploy_apex_triggers_internal(sf, package)
+        return dumps_json({
+            "success": res.get("success", False),
+            "operation": "upsert_apex_triggers_bulk",
+            "created": created,
+            "updated": updated,
+            "skipped": skipped,
+            "job_id": res.get("job_id"),
+            "message": f"Deployed {len(package)} Apex trigger(s)" if res.get("success") else f"Failed to deploy {len(package)} Apex trigger(s)",
+            "errors": res.get("details") if not res.get("success") else None
+        })
 
     except Exception as e:
-        logger.error("upsert_apex_trigger: %s", e, exc_info=True)
-        return json.dumps({"success": False, "error": str(e)}, indent=2)
+        logger.error("upsert_apex_triggers_bulk failed: %r", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # =============================================================================
@@ -1164,18 +1950,18 @@ def fetch_validation_rule(object_name: str, rule_name: str) -> str:
 Tooling and Core API fields into one normalized payload.
 
 What it does:
-- Runs a Tooling SOQL to retrieve the validation rule **Active**, `ErrorConditionFormula`,
-  `ErrorDisplayField`, `ErrorMessage`, `Description`, timestamps, and actor IDs.
-- Enriches with Core API fields for human-friendly names:
-  `CreatedBy.Name`, `LastModifiedBy.Name`, and `NamespacePrefix`.
+- Runs a single Tooling SOQL to retrieve the validation rule **Active**, `ErrorConditionFormula`,
+  `ErrorDisplayField`, `ErrorMessage`, `Description`, timestamps, and actor IDs, plus
+  `CreatedBy.Name`, `LastModifiedBy.Name`, and `NamespacePrefix`
+  (flattened into `CreatedByName` / `LastModifiedByName`).
 - Strips Salesforce `attributes` for a cleaner result.
 - Returns a JSON string with `"success": true` and a `data` object on success.
 
 Notes & caveats:
-- **Uniqueness**: `ValidationRule.Name` is unique per object; this function expects
-  at most one match and returns the first (uses implicit LIMIT via single record).
-- **Quoting**: The SOQL interpolates `object_name` and `rule_name`. Prefer a helper like
-  `soql_quote()` to avoid malformed queries when adapting this function.
+- **Uniqueness**: `ValidationRule.Name` is unique per object; the query filters on
+  `Name` first and uses `LIMIT 1`.
+- **Quoting**: `object_name` and `rule_name` are bound into the SOQL via
+  `_soql_quote()`, so quotes or backslashes cannot break the query.
 - **Read-only**: No updates or deploys are performed here. Use
   `create_validation_rule(...)` or `upsert_validation_rule(...)` for changes.
 - **Dependencies**: This function does not validate any referenced fields or objects
@@ -1224,38 +2010,92 @@ Examples:
         active = res["data"]["Active"]
 """
 
+    return dumps_json(_fetch_validation_rule_impl(object_name, rule_name))
+
+
+def _flatten_validation_rule(rule: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten CreatedBy / LastModifiedBy names and drop `attributes` (in place).
+
+    Relationships come back null for system-created rules; those map to None.
+    """
+    rule["CreatedByName"] = _nested(rule.pop("CreatedBy", None), "Name")
+    rule["LastModifiedByName"] = _nested(rule.pop("LastModifiedBy", None), "Name")
+    rule.pop("attributes", None)
+    return rule
+
+
+def _fetch_validation_rule_impl(object_name: str, rule_name: str) -> Dict[str, Any]:
+    """`fetch_validation_rule` as a plain dict, for in-process callers that would
+    otherwise json.loads() the tool's string result."""
     try:
         sf = get_salesforce_connection()
 
-        tooling_q = (
-            "SELECT Id, Name, Active, ErrorConditionFormula, ErrorDisplayField, ErrorMessage, "
-            "Description, CreatedDate, CreatedById, LastModifiedDate, LastModifiedById "
-            f"FROM ValidationRule WHERE EntityDefinition.QualifiedApiName = '{object_name}' AND Name = '{rule_name}'"
-        )
-        tooling_res = sf.toolingexecute(f"query/?q={tooling_q}")
-        if tooling_res.get("size") == 0:
-            return json.dumps({"success": False, "error": f"ValidationRule '{rule_name}' not found on object '{object_name}'"}, indent=2)
-        rule = tooling_res["records"][0]
+        # Tooling exposes the actor names and NamespacePrefix directly, so one
+        # query replaces the former Tooling + Core pair.
+        tooling_q = _VR_DETAIL_Q.format(name=_soql_quote(rule_name), obj=_soql_quote(object_name))
+        tooling_res = _tooling_query(sf, tooling_q)
+        if not tooling_res.get("records"):
+            return {"success": False, "error": f"ValidationRule '{rule_name}' not found on object '{object_name}'"}
 
-        # add CreatedBy / LastModifiedBy names
-        core_q = (
-            "SELECT Id, NamespacePrefix, CreatedBy.Name, LastModifiedBy.Name "
-            f"FROM ValidationRule WHERE EntityDefinition.QualifiedApiName = '{object_name}' AND Name = '{rule_name}'"
+        return {"success": True, "data": _flatten_validation_rule(tooling_res["records"][0])}
+
+    except Exception as e:
+        logger.error("fetch_validation_rule: %s", e, exc_info=True)
+        return {"success": False, "error": str(e)}
+
+
+@register_tool
+def fetch_validation_rules(object_name: str, rule_names: List[str]) -> str:
+    """Fetch several **ValidationRules** on one object in a single Tooling query.
+
+Use this instead of repeated `fetch_metadata("ValidationRule", ...)` calls when
+auditing an object: all rules come back from one `Name IN (...)` SOQL.
+
+Args:
+    object_name (str): The sObject API name (e.g., "Account").
+    rule_names (List[str]): ValidationRule `Name`s (DeveloperNames).
+
+Returns:
+    str: JSON-encoded string.
+
+    {
+      "success": true,
+      "object_name": "Account",
+      "data": {"AccountNameRequired": { ...same fields as fetch_validation_rule... }},
+      "missing": ["SomeOtherRule"]
+    }
+"""
+    # Rule names are case-insensitive in Salesforce; dedupe and match on lower case
+    by_lower: Dict[str, str] = {}
+    for n in rule_names or []:
+        by_lower.setdefault(n.lower(), n)
+    names = list(by_lower.values())
+    if not names:
+        return dumps_json({"success": False, "error": "No rule names provided"})
+    bad = [n for n in names if not _NAME_RE.match(n)]
+    if bad:
+        return dumps_json({"success": False, "error": f"Invalid rule name(s): {', '.join(bad)}"})
+
+    try:
+        sf = get_salesforce_connection()
+        tooling_q = _VR_DETAIL_IN_Q.format(
+            names=", ".join(_soql_quote(n) for n in names), obj=_soql_quote(object_name)
         )
-        core_res = sf.query(core_q)
-        if core_res.get("records"):
-            extra = core_res["records"][0]
-            rule["CreatedByName"] = extra["CreatedBy"]["Name"]
-            rule["LastModifiedByName"] = extra["LastModifiedBy"]["Name"]
-            rule["NamespacePrefix"] = extra["NamespacePrefix"]
+        records = _tooling_query(sf, tooling_q).get("records") or []
 
-        rule.pop("attributes", None)
+        rules = {rule["Name"]: _flatten_validation_rule(rule) for rule in records}
+        found = {name.lower() for name in rules}
 
-        return json.dumps({"success": True, "data": rule}, indent=2)
+        return dumps_json({
+            "success": True,
+            "object_name": object_name,
+            "data": rules,
+            "missing": [n for n in names if n.lower() not in found],
+        })
 
     except Exception as e:
-        logger.error("fetch_validation_rule: %s", e, exc_info=True)
-        return json.dumps({"success": False, "error": str(e)}, indent=2)
+        logger.error("fetch_validation_rules: %s", e, exc_info=True)
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -1371,59 +2211,52 @@ res = json.loads(create_validation_rule(
 assert res["success"], res
 """
 
+    # Validate rule name (before any network call)
+    if not _NAME_RE.match(rule_name or ""):
+        return dumps_json(
+            {"success": False, "error": "Invalid rule name. Use only alphanumeric characters and underscores."}
+        )
+    if error_display_field and not _FIELD_NAME_RE.match(error_display_field):
+        return dumps_json(
+            {"success": False, "error": f"Invalid error display field name '{error_display_field}'"}
+        )
+
     try:
         sf = get_salesforce_connection()
 
-        # Check if validation rule already exists (must use Tooling API)
-        check_query = f"SELECT Id FROM ValidationRule WHERE EntityDefinition.QualifiedApiName = '{object_name}' AND Name = '{rule_name}'"
-        check = sf.toolingexecute(f"query/?q={check_query}")
-        if check.get("size", 0) > 0:
-            return json.dumps(
+        # Existence check (Tooling) and object lookup are independent; run both at once
+        exists_future = _preflight_pool.submit(_validation_rule_exists, sf, object_name, rule_name)
+        object_future = _preflight_pool.submit(_object_exists, sf, object_name)
+
+        # Check if validation rule already exists (must use Tooling API; cached briefly)
+        if exists_future.result():
+            return dumps_json(
                 {
                     "success": False,
                     "error": f"ValidationRule '{rule_name}' already exists on object '{object_name}'. Use upsert_validation_rule to update it.",
-                },
-                indent=2,
+                }
             )
 
-        # Validate rule name
-        if not rule_name.replace("_", "").isalnum():
-            return json.dumps(
-                {"success": False, "error": "Invalid rule name. Use only alphanumeric characters and underscores."},
-                indent=2,
+        # Validate object exists (describeGlobal, cached)
+        if not object_future.result():
+            return dumps_json(
+                {"success": False, "error": f"Target object '{object_name}' not found"}
             )
 
-        # Validate object exists
-        try:
-            getattr(sf, object_name).describe()
-        except Exception:
-            return json.dumps(
-                {"success": False, "error": f"Target object '{object_name}' not found"},
-                indent=2,
+        # Validate error display field if provided (only now is per-object data needed)
+        if error_display_field and not _field_exists(sf, object_name, error_display_field):
+            return dumps_json(
+                {"success": False, "error": f"Error display field '{error_display_field}' not found on object '{object_name}'"}
             )
 
-        # Validate error display field if provided
-        if error_display_field:
-            try:
-                desc = getattr(sf, object_name).describe()
-                field_exists = any(f["name"] == error_display_field for f in desc["fields"])
-                if not field_exists:
-                    return json.dumps(
-                        {"success": False, "error": f"Error display field '{error_display_field}' not found on object '{object_name}'"},
-                        indent=2,
-                    )
-            except Exception:
-                return json.dumps(
-                    {"success": False, "error": f"Could not validate error display field '{error_display_field}' on object '{object_name}'"},
-                    indent=2,
-                )
-
         res = deploy_validation_rule_internal(
             sf, object_name, rule_name, error_condition_formula, 
             error_message, error_display_field, description, active
         )
+        if res.get("success"):
+            _mark_validation_rule_exists(sf, object_name, rule_name)
         
-        return json.dumps({
+        return dumps_json({
             "success": res.get("success", False),
             "operation": "create_validation_rule",
             "object_name": object_name,
@@ -1431,11 +2264,11 @@ assert res["success"], res
             "message": f"Successfully created ValidationRule '{rule_name}' on {object_name}" if res.get("success") else f"Failed to create ValidationRule '{rule_name}' on {object_name}",
             "job_id": res.get("job_id"),
             "errors": res.get("details") if not res.get("success") else None
-        }, indent=2)
+        })
 
     except Exception as e:
         logger.error("create_validation_rule: %s", e, exc_info=True)
-        return json.dumps({"success": False, "error": str(e)}, indent=2)
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -1550,42 +2383,63 @@ Implementation notes:
   - regex-scans formula strings for field tokens, and
   - calls `fetch_custom_field` for each token.
 """
+    # Cheap local checks before any network call
+    if not _NAME_RE.match(rule_name or ""):
+        return dumps_json(
+            {"success": False, "error": "Invalid rule name. Use only alphanumeric characters and underscores."}
+        )
+    if error_display_field and not _FIELD_NAME_RE.match(error_display_field):
+        return dumps_json(
+            {"success": False, "error": f"Invalid error display field name '{error_display_field}'"}
+        )
+
     try:
         sf = get_salesforce_connection()
-        # Must use Tooling API for ValidationRule
-        check_query = f"SELECT Id FROM ValidationRule WHERE EntityDefinition.QualifiedApiName = '{object_name}' AND Name = '{rule_name}'"
-        check = sf.toolingexecute(f"query/?q={check_query}")
-        if check.get("size", 0) == 0:
-            return json.dumps(
+        # Must use Tooling API for ValidationRule. Fetch the current values with
+        # the existence check so an unchanged rule skips the deploy entirely.
+        current = _fetch_validation_rule_state(sf, object_name, rule_name)
+        if current is None:
+            return dumps_json(
                 {
                     "success": False,
                     "error": f"ValidationRule '{rule_name}' not found on object '{object_name}' (use create_validation_rule to create new rules)",
-                },
-                indent=2,
+                }
             )
 
+        if _validation_rule_unchanged(
+            current, error_condition_formula, error_message, error_display_field, description, active
+        ):
+            return dumps_json({
+                "success": True,
+                "skipped": True,
+                "operation": "update_validation_rule",
+                "object_name": object_name,
+                "rule_name": rule_name,
+                "message": f"No changes to ValidationRule '{rule_name}' on {object_name}; skipped deploy",
+                "job_id": None,
+                "errors": None
+            })
+
         # Validate error display field if provided
         if error_display_field:
             try:
-                desc = getattr(sf, object_name).describe()
-                field_exists = any(f["name"] == error_display_field for f in desc["fields"])
-                if not field_exists:
-                    return json.dumps(
-                        {"success": False, "error": f"Error display field '{error_display_field}' not found on object '{object_name}'"},
-                        indent=2,
+                if not _field_exists(sf, object_name, error_display_field):
+                    return dumps_json(
+                        {"success": False, "error": f"Error display field '{error_display_field}' not found on object '{object_name}'"}
                     )
             except Exception:
-                return json.dumps(
-                    {"success": False, "error": f"Could not validate error display field '{error_display_field}' on object '{object_name}'"},
-                    indent=2,
+                return dumps_json(
+                    {"success": False, "error": f"Could not validate error display field '{error_display_field}' on object '{object_name}'"}
                 )
 
         res = deploy_validation_rule_internal(
             sf, object_name, rule_name, error_condition_formula, 
             error_message, error_display_field, description, active
         )
+        if res.get("success"):
+            _mark_validation_rule_exists(sf, object_name, rule_name)
         
-        return json.dumps({
+        return dumps_json({
             "success": res.get("success", False),
             "operation": "update_validation_rule",
             "object_name": object_name,
@@ -1593,17 +2447,170 @@ Implementation notes:
             "message": f"Successfully updated ValidationRule '{rule_name}' on {object_name}" if res.get("success") else f"Failed to update ValidationRule '{rule_name}' on {object_name}",
             "job_id": res.get("job_id"),
             "errors": res.get("details") if not res.get("success") else None
-        }, indent=2)
+        })
 
     except Exception as e:
         logger.error("upsert_validation_rule: %s", e, exc_info=True)
-        return json.dumps({"success": False, "error": str(e)}, indent=2)
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # =============================================================================
 # LWC TOOLS (ENHANCED WITH CREATE)
 # =============================================================================
 
+# `@salesforce/apex/Class.method` imports in LWC JavaScript
+_APEX_IMPORT_RE = re.compile(r"@salesforce/apex/([A-Za-z_][A-Za-z0-9_]*)\.([A-Za-z_][A-Za-z0-9_]*)")
+# Identifiers followed by "(" in an Apex body: method declarations (and calls)
+_APEX_METHOD_NAME_RE = re.compile(r"\b([A-Za-z_][A-Za-z0-9_]*)\s*\(")
+
+# Bundle file extension -> `files` key; `.js-meta.xml` is special-cased as "xml"
+_EXT_TO_KEY = {"html": "html", "js": "js", "css": "css", "svg": "svg"}
+
+
+def _lwc_file_key(file_path: str) -> Tuple[Optional[str], str]:
+    """Return (`files` key or None for other assets, file name) for a resource path."""
+    name = file_path.rpartition("/")[2]
+    if name.endswith(".js-meta.xml"):
+        return "xml", name
+    return _EXT_TO_KEY.get(name.rpartition(".")[2].lower()), name
+
+
+# Generated js-meta.xml for create/upsert: exposed on App/Home/Record pages
+_LWC_META_XML_TMPL = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<LightningComponentBundle xmlns="http://soap.sforce.com/2006/04/metadata">\n'
+    "  <apiVersion>{api}</apiVersion>\n"
+    "  <isExposed>true</isExposed>\n"
+    "  <targets>\n"
+    "    <target>lightning__AppPage</target>\n"
+    "    <target>lightning__HomePage</target>\n"
+    "    <target>lightning__RecordPage</target>\n"
+    "  </targets>\n"
+    "</LightningComponentBundle>"
+)
+
+# LWC Tooling queries; fill with .format() (names via _soql_quote())
+_LWC_BUNDLE_Q = "SELECT {fields} FROM LightningComponentBundle WHERE DeveloperName = {name} LIMIT 1"
+_LWC_RESOURCE_Q = "SELECT {fields} FROM LightningComponentResource WHERE LightningComponentBundleId = "
+
+
+# ApexClass bodies for the LWC Apex-import check, keyed by (instance, class name).
+# False marks a class that does not exist. Short TTL; deploys drop their entry.
+_apex_body_cache = TTLCache(maxsize=512, ttl=60)
+
+
+_APEX_BODY_BATCH = 200  # names per `Name IN (...)`, well inside the SOQL length limit
+
+
+def _fetch_apex_bodies(sf_connection, class_names) -> Dict[str, Optional[str]]:
+    """Return {class name: body or None if missing}, cached per class.
+
+    Uncached names are fetched with one `Name IN (...)` Tooling query per
+    batch of `_APEX_BODY_BATCH` instead of one query per class.
+    """
+    instance = getattr(sf_connection, "sf_instance", None)
+    bodies: Dict[str, Any] = {}
+    missing: List[str] = []
+    for name in dict.fromkeys(class_names):
+        body = _apex_body_cache.get((instance, name))
+        if body is None:
+            missing.append(name)
+        else:
+            bodies[name] = body
+
+    names = iter(missing)
+    while True:
+        batch = list(islice(names, _APEX_BODY_BATCH))
+        if not batch:
+            break
+        res = _tooling_query(
+            sf_connection,
+            f"SELECT Name, Body FROM ApexClass WHERE Name IN ({', '.join(_soql_quote(n) for n in batch)})",
+        )
+        # Apex names are case-insensitive; match on the lower-cased name
+        found = {r["Name"].lower(): r.get("Body") or "" for r in res.get("records") or []}
+        for name in batch:
+            body = found.get(name.lower(), False)
+            _apex_body_cache.set((instance, name), body)
+            bodies[name] = body
+
+    return {name: (body if body is not False else None) for name, body in bodies.items()}
+
+
+# LightningComponentBundle field names per (instance, API version); the
+# describe is static for an org/version, so it is fetched once per process.
+_lwc_bundle_fields_cache = TTLCache(maxsize=8, ttl=3600)
+
+
+def _lwc_bundle_with_resources(
+    sf_connection, bundle_q: str, resource_cols: str
+) -> Tuple[Optional[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+    """Return (bundle record or None, iterator over its LightningComponentResource records).
+
+    Both queries travel in one Tooling composite call, the resource query
+    chained on the bundle Id via `@{bundle.records[0].Id}`. If composite is
+    unavailable, falls back to two sequential queries. Further resource pages
+    are fetched as the iterator is consumed.
+    """
+    base = f"/services/data/v{sf_connection.sf_version}/tooling/query/?q="
+    res_prefix = _LWC_RESOURCE_Q.format(fields=resource_cols)
+    body = {
+        "allOrNone": False,
+        "compositeRequest": [
+            {"method": "GET", "url": base + quote_plus(bundle_q), "referenceId": "bundle"},
+            {
+                "method": "GET",
+                "url": base + quote_plus(res_prefix) + "%27@{bundle.records[0].Id}%27",
+                "referenceId": "resources",
+            },
+        ],
+    }
+    try:
+        res = sf_connection.restful("tooling/composite", method="POST", json=body)
+        subs = {sub.get("referenceId"): sub for sub in res.get("compositeResponse", [])}
+    except Exception as e:
+        logger.debug("LWC composite fetch unavailable, using two queries: %s", e)
+        subs = {}
+
+    bundle_sub = subs.get("bundle") or {}
+    if bundle_sub.get("httpStatusCode", 500) < 400:
+        bundles = (bundle_sub.get("body") or {}).get("records") or []
+        if not bundles:
+            return None, iter(())
+        res_sub = subs.get("resources") or {}
+        if res_sub.get("httpStatusCode", 500) < 400:
+            return bundles[0], _iter_tooling_records(sf_connection, res_sub.get("body") or {})
+
+    bundles = _tooling_query(sf_connection, bundle_q).get("records") or []
+    if not bundles:
+        return None, iter(())
+    resources = _tooling_query(sf_connection, res_prefix + _soql_quote(bundles[0]["Id"]))
+    return bundles[0], _iter_tooling_records(sf_connection, resources)
+
+
+def _connection_api_version(sf_connection) -> str:
+    """API version the connection was built with (fixed for its lifetime), else the default.
+
+    simple_salesforce sets `sf_version` once in its constructor, so this never
+    touches the network.
+    """
+    return getattr(sf_connection, "sf_version", None) or _DEFAULT_API_VERSION
+
+
+def _describe_lwc_bundle_fields(sf_connection) -> frozenset:
+    """Cached bundle field names, or an empty set if the describe fails (not cached)."""
+    key = (getattr(sf_connection, "sf_instance", None), _connection_api_version(sf_connection))
+    fields = _lwc_bundle_fields_cache.get(key)
+    if fields is None:
+        try:
+            describe = sf_connection.toolingexecute("sobjects/LightningComponentBundle/describe/")
+        except Exception:
+            return frozenset()
+        fields = frozenset(f["name"] for f in describe.get("fields", []))
+        _lwc_bundle_fields_cache.set(key, fields)
+    return fields
+
+
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
 # @register_tool
 def fetch_lwc_component(component_name: str) -> str:
@@ -1614,8 +2621,8 @@ This is a **read-only** utility that:
 - First **describes** the object to detect which optional columns exist in this org
   (e.g., `Targets`, `TargetConfigs`, `LwcResources`) so the query won’t break on
   older/newer API versions.
-- Retrieves **all resources** (`LightningComponentResource`) for the bundle and
-  collates them into a friendly `files` map:
+- Retrieves **all resources** (`LightningComponentResource`, `FilePath` and
+  `Source` only) for the bundle and collates them into a friendly `files` map:
     - `html` → the component’s `.html`
     - `js`   → the component’s `.js` (excluding `*-meta.xml`)
     - `xml`  → the component’s `*-meta.xml`
@@ -1630,8 +2637,8 @@ Notes & caveats:
 - **Output stability**: If a file isn’t present in the bundle, its key is simply
   omitted from `files`. Do not assume `html`, `js`, or `xml` always exist.
 - **Namespace**: The `bundle` includes `NamespacePrefix` (if any).
-- **Quoting**: The query interpolates `component_name`; if you adapt this function,
-  use a small helper like `soql_quote()` to avoid malformed queries.
+- **Quoting**: `component_name` is bound into the SOQL via `_soql_quote()`, so
+  quotes or backslashes cannot break the query.
 
 Args:
     component_name (str): The bundle `DeveloperName`, e.g., "accountHeader".
@@ -1691,12 +2698,8 @@ Examples:
     try:
         sf = get_salesforce_connection()
 
-        # Describe LightningComponentBundle to know optional fields
-        try:
-            describe = sf.toolingexecute("sobjects/LightningComponentBundle/describe/")
-            available = {f["name"] for f in describe.get("fields", [])}
-        except Exception:
-            available = set()
+        # Describe LightningComponentBundle (cached) to know optional fields
+        available = _describe_lwc_bundle_fields(sf)
 
         base = [
             "Id",
@@ -1713,52 +2716,29 @@ Examples:
         ]
         optional = [f for f in ("Targets", "TargetConfigs", "LwcResources") if f in available]
         query_fields = ", ".join(base + optional)
-        bundle_q = (
-            f"SELECT {query_fields} FROM LightningComponentBundle "
-            f"WHERE DeveloperName = '{component_name}' LIMIT 1"
-        )
+        bundle_q = _LWC_BUNDLE_Q.format(fields=query_fields, name=_soql_quote(component_name))
 
-        bundle_res = sf.toolingexecute(f"query/?q={bundle_q}")
-        if bundle_res.get("size") == 0:
-            return json.dumps({"success": False, "error": "Component not found"}, indent=2)
-        bundle = bundle_res["records"][0]
-        bundle_id = bundle["Id"]
-
-        # Resources
-        res_q = (
-            "SELECT Id, FilePath, Format, Source, CreatedDate, LastModifiedDate "
-            f"FROM LightningComponentResource WHERE LightningComponentBundleId = '{bundle_id}'"
-        )
-        res = sf.toolingexecute(f"query/?q={res_q}")
+        # Bundle + resources in one composite round-trip
+        # Only FilePath/Source feed `files`; resource Ids/timestamps are not returned
+        bundle, resources = _lwc_bundle_with_resources(sf, bundle_q, "FilePath, Source")
+        if bundle is None:
+            return _ERR_LWC_NOT_FOUND
 
         files = {}
-        for r in res.get("records", []):
-            path = r["FilePath"]
-            source = r["Source"]
-            name = path.split("/")[-1]
-            ext = name.split(".")[-1].lower()
-            if ext == "html":
-                files["html"] = source
-            elif ext == "js" and not name.endswith(".js-meta.xml"):
-                files["js"] = source
-            elif name.endswith(".js-meta.xml"):
-                files["xml"] = source
-            elif ext == "css":
-                files["css"] = source
-            elif ext == "svg":
-                files["svg"] = source
-            else:
-                files[name] = source
+        for r in resources:
+            key, name = _lwc_file_key(r["FilePath"])
+            files[key or name] = r["Source"]
 
-        bundle.pop("attributes", None)
-        return json.dumps(
-            {"success": True, "bundle": bundle, "files": files},
-            indent=2,
-        )
+        # Project away Salesforce `attributes` rather than mutating the record
+        return dumps_json({
+            "success": True,
+            "bundle": {k: v for k, v in bundle.items() if k != "attributes"},
+            "files": files,
+        })
 
     except Exception as e:
         logger.error("fetch_lwc_component: %s", e, exc_info=True)
-        return json.dumps({"success": False, "error": str(e)}, indent=2)
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -1786,10 +2766,10 @@ def create_lwc_component(
     Safety (best practice):
     # ---- Name validation (LWC bundle) ----
     if not _validate_lwc_bundle_name(component_name):
-        return json.dumps({
+        return dumps_json({
             "success": False,
             "error": "Invalid LWC bundle name. Must start with a lowercase letter and contain only letters, numbers, or underscores."
-        }, indent=2)
+        })
     - **No hypothetical dependencies**: If your JS imports Apex
       (`@salesforce/apex/Class.method`) or references objects/fields, verify those
       exist separately before you deploy. This function does not auto-create or
@@ -1851,27 +2831,21 @@ def create_lwc_component(
         sf = get_salesforce_connection()
 
         # ---- Validate component name ----
-        if not component_name or not component_name.replace("_", "").replace("-", "").isalnum():
-            return json.dumps(
-                {"success": False, "error": "Invalid component name. Use only alphanumeric characters, underscores, and hyphens."},
-                indent=2
-            )
+        if not component_name or not _LWC_COMPONENT_NAME_RE.fullmatch(component_name):
+            return _ERR_LWC_INVALID_NAME
 
         # ---- Existence check (Tooling) ----
         try:
-            tooling_query = f"SELECT Id FROM LightningComponentBundle WHERE DeveloperName = '{component_name}'"
-            exists = sf.toolingexecute(f"query/?q={tooling_query}")
+            tooling_query = _LWC_BUNDLE_Q.format(fields="Id", name=_soql_quote(component_name))
+            exists = _tooling_query(sf, tooling_query)
             if exists.get("size", 0) > 0:
-                return json.dumps(
-                    {"success": False, "error": f"LWC component '{component_name}' already exists. Use upsert_lwc_component to update it."},
-                    indent=2
-                )
+                return _ERR_LWC_EXISTS_FMT % component_name
         except Exception as tooling_error:
             # If Tooling API fails, continue; the deploy will fail if it truly exists.
             logger.warning(f"Tooling API check failed: {tooling_error}. Proceeding with deployment.")
 
         # ---- Determine API version ----
-        api_version = getattr(sf, "sf_version", "59.0")
+        api_version = _connection_api_version(sf)
 
         # ---- Generate defaults if caller passed blank content ----
         if not html_content.strip():
@@ -1892,16 +2866,7 @@ export default class {safe_class} extends LightningElement {{}}
 """
 
         # ---- Predefined meta XML: App/Home/Record enabled ----
-        xml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<LightningComponentBundle xmlns="http://soap.sforce.com/2006/04/metadata">
-  <apiVersion>{api_version}</apiVersion>
-  <isExposed>true</isExposed>
-  <targets>
-    <target>lightning__AppPage</target>
-    <target>lightning__HomePage</target>
-    <target>lightning__RecordPage</target>
-  </targets>
-</LightningComponentBundle>"""
+        xml_content = _LWC_META_XML_TMPL.format(api=api_version)
 
         # ---- Files payload ----
         files = {
@@ -1915,20 +2880,20 @@ export default class {safe_class} extends LightningElement {{}}
         # ---- Deploy ----
         res = deploy_lwc_component_internal(sf, component_name, files)
 
-        return json.dumps({
+        return dumps_json({
             "success": res.get("success", False),
             "operation": "create_lwc_component",
             "component_name": component_name,
             "api_version": api_version,
-            "files_created": list(files.keys()),
+            "files_created": tuple(files),
             "message": f"Successfully created LWC component '{component_name}'" if res.get("success") else f"Failed to create LWC component '{component_name}'",
             "job_id": res.get("job_id"),
             "errors": res.get("details") if not res.get("success") else None
-        }, indent=2)
+        })
 
     except Exception as e:
         logger.error("create_lwc_component: %s", e, exc_info=True)
-        return json.dumps({"success": False, "error": str(e)}, indent=2)
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -1937,7 +2902,8 @@ def upsert_lwc_component(
     component_name: str,
     html_content: str,
     js_content: str,
-    css_content: str = ""
+    css_content: str = "",
+    return_previous: bool = False
 ) -> str:
     """Update an existing **LWC bundle** using four inputs: name, HTML, JS, CSS.
     The component’s meta XML is auto-generated inside this function with
@@ -1946,10 +2912,10 @@ def upsert_lwc_component(
     Safety & preflight (built-in + caller responsibilities):
     # ---- Name validation (LWC bundle) ----
     if not _validate_lwc_bundle_name(component_name):
-        return json.dumps({
+        return dumps_json({
             "success": False,
             "error": "Invalid LWC bundle name. Must start with a lowercase letter and contain only letters, numbers, or underscores."
-        }, indent=2)
+        })
     - **Existence check (built-in):** Verifies the bundle exists via Tooling API.
       This function does not create new bundles.
     - **Apex import verification (built-in, best-effort):** Scans JS for
@@ -1971,6 +2937,9 @@ def upsert_lwc_component(
                               Apex, ensure the class/method actually exists & is
                               `@AuraEnabled`.
         css_content (str):    Optional stylesheet contents.
+        return_previous (bool): Also fetch the bundle's current html/js/xml/css/svg
+                              (same Tooling round-trip as the existence check) and
+                              return them as `previous_files`. Off by default.
 
     Returns:
         str: JSON-encoded string.
@@ -2017,101 +2986,87 @@ def upsert_lwc_component(
 
         upsert_lwc_component("accountHeader", html, js, css)
     """
-    import re
     try:
         sf = get_salesforce_connection()
 
         # ---- Validate component name (keep parity with your create() rules) ----
-        if not component_name or not component_name.replace("_", "").replace("-", "").isalnum():
-            return json.dumps(
-                {"success": False, "error": "Invalid component name. Use only letters, numbers, underscores, and hyphens."},
-                indent=2
-            )
+        if not component_name or not _LWC_COMPONENT_NAME_RE.fullmatch(component_name):
+            return _ERR_LWC_INVALID_NAME_UPSERT
 
         # ---- Must provide HTML & JS ----
         if not html_content or not html_content.strip():
-            return json.dumps({"success": False, "error": "Missing required file content: html"}, indent=2)
+            return _ERR_LWC_MISSING_HTML
         if not js_content or not js_content.strip():
-            return json.dumps({"success": False, "error": "Missing required file content: js"}, indent=2)
+            return _ERR_LWC_MISSING_JS
+
+        # ---- Existence check and Apex class lookup are independent; overlap them ----
+        tooling_query = _LWC_BUNDLE_Q.format(fields="Id", name=_soql_quote(component_name))
+        if return_previous:
+            exists_future = _preflight_pool.submit(_lwc_bundle_with_resources, sf, tooling_query, "FilePath, Source")
+        else:
+            exists_future = _preflight_pool.submit(_tooling_query, sf, tooling_query)
+        # Most components import no Apex: a substring test skips the regex and the query
+        apex_refs = _APEX_IMPORT_RE.findall(js_content) if "@salesforce/apex/" in js_content else []
+        # One batched lookup for all distinct classes, not one per imported method
+        apex_future = (
+            _preflight_pool.submit(_fetch_apex_bodies, sf, {c for c, _ in apex_refs}) if apex_refs else None
+        )
 
-        # ---- Ensure bundle exists ----
+        # ---- Ensure bundle exists (resources only when the caller wants them back) ----
         try:
-            tooling_query = f"SELECT Id FROM LightningComponentBundle WHERE DeveloperName = '{component_name}'"
-            exists = sf.toolingexecute(f"query/?q={tooling_query}")
-            if exists.get("size", 0) == 0:
-                return json.dumps(
-                    {"success": False, "error": "Component not found (use create_lwc_component to create new components)"},
-                    indent=2
-                )
-            bundle_id = exists["records"][0]["Id"]
+            if return_previous:
+                bundle, resources = exists_future.result()
+            else:
+                records = exists_future.result().get("records") or []
+                bundle, resources = (records[0] if records else None), iter(())
         except Exception as tooling_error:
             logger.warning(f"Tooling API existence check failed: {tooling_error}")
+            if apex_future is not None:
+                apex_future.cancel()
             # If we can't verify existence, better to fail closed than overwrite wrong bundle
-            return json.dumps({"success": False, "error": "Unable to verify LWC existence via Tooling API"}, indent=2)
-
-        # ---- Fetch current bundle (read-only) to help callers diff locally if needed ----
-        try:
-            res_q = (
-                "SELECT Id, FilePath, Format, Source "
-                f"FROM LightningComponentResource WHERE LightningComponentBundleId = '{bundle_id}'"
-            )
-            res = sf.toolingexecute(f"query/?q={res_q}")
-            current_files = {}
-            for r in res.get("records", []):
-                name = r["FilePath"].split("/")[-1]
-                ext = name.split(".")[-1].lower()
-                if ext == "html":
-                    current_files["html"] = r.get("Source", "")
-                elif ext == "js" and not name.endswith(".js-meta.xml"):
-                    current_files["js"] = r.get("Source", "")
-                elif name.endswith(".js-meta.xml"):
-                    current_files["xml"] = r.get("Source", "")
-                elif ext == "css":
-                    current_files["css"] = r.get("Source", "")
-                elif ext == "svg":
-                    current_files["svg"] = r.get("Source", "")
-        except Exception as fetch_err:
-            logger.warning(f"Fetch existing LWC resources failed: {fetch_err}")
+            return dumps_json({"success": False, "error": "Unable to verify LWC existence via Tooling API"})
+        if bundle is None:
+            if apex_future is not None:
+                apex_future.cancel()
+            return _ERR_LWC_NOT_FOUND_UPSERT
+
+        # ---- Current bundle files (read-only) so callers can diff ----
+        previous_files = {}
+        for r in resources:
+            key, _ = _lwc_file_key(r["FilePath"])
+            if key:
+                previous_files[key] = r.get("Source", "")
 
         # ---- Best-effort Apex import verification from JS ----
         try:
-            apex_refs = re.findall(
-                r"@salesforce/apex/([A-Za-z_][A-Za-z0-9_]*)\.([A-Za-z_][A-Za-z0-9_]*)",
-                js_content
-            )
             apex_errors = []
-            for cls, method in apex_refs:
-                a = sf.toolingexecute(
-                    "query/?q=" +
-                    f"SELECT Id, Name, Body FROM ApexClass WHERE Name = '{cls}' LIMIT 1"
+            bodies = apex_future.result() if apex_future is not None else {}
+            # One scan per class: (method names, has @AuraEnabled), or None if missing
+            scanned = {
+                cls: None if body is None else (
+                    set(_APEX_METHOD_NAME_RE.findall(body)), "@AuraEnabled" in body
                 )
-                if a.get("size", 0) == 0:
+                for cls, body in bodies.items()
+            }
+            for cls, method in apex_refs:
+                info = scanned[cls]
+                if info is None:
                     apex_errors.append(f"Apex class '{cls}' not found")
                     continue
-                body = a["records"][0].get("Body", "") or ""
+                methods_in_body, has_aura = info
                 # Heuristic: method name present and '@AuraEnabled' present in class body
-                if method not in body or "@AuraEnabled" not in body:
+                if method not in methods_in_body or not has_aura:
                     apex_errors.append(f"Apex method '{cls}.{method}' not found or not @AuraEnabled")
             if apex_errors:
-                return json.dumps(
-                    {"success": False, "error": "Apex reference check failed", "details": apex_errors},
-                    indent=2
+                return dumps_json(
+                    {"success": False, "error": "Apex reference check failed", "details": apex_errors}
                 )
         except Exception as v_err:
             logger.warning(f"Apex reference precheck failed (continuing): {v_err}")
 
         # ---- Predefined meta XML (App/Home/Record enabled by default) ----
-        api_ver = getattr(sf, "sf_version", "59.0")
-        xml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<LightningComponentBundle xmlns="http://soap.sforce.com/2006/04/metadata">
-  <apiVersion>{api_ver}</apiVersion>
-  <isExposed>true</isExposed>
-  <targets>
-    <target>lightning__AppPage</target>
-    <target>lightning__HomePage</target>
-    <target>lightning__RecordPage</target>
-  </targets>
-</LightningComponentBundle>"""
+        api_ver = _connection_api_version(sf)
+        xml_content = _LWC_META_XML_TMPL.format(api=api_ver)
 
         # ---- Build payload for deployment ----
         files = {
@@ -2125,26 +3080,26 @@ def upsert_lwc_component(
         # ---- Deploy update ----
         res = deploy_lwc_component_internal(sf, component_name, files)
 
-        return json.dumps(
-            {
-                "success": res.get("success", False),
-                "operation": "update_lwc_component",
-                "component_name": component_name,
-                "files_updated": list(files.keys()),
-                "message": (
-                    f"Successfully updated LWC component '{component_name}'"
-                    if res.get("success") else
-                    f"Failed to update LWC component '{component_name}'"
-                ),
-                "job_id": res.get("job_id"),
-                "errors": res.get("details") if not res.get("success") else None
-            },
-            indent=2
-        )
+        response = {
+            "success": res.get("success", False),
+            "operation": "update_lwc_component",
+            "component_name": component_name,
+            "files_updated": tuple(files),
+            "message": (
+                f"Successfully updated LWC component '{component_name}'"
+                if res.get("success") else
+                f"Failed to update LWC component '{component_name}'"
+            ),
+            "job_id": res.get("job_id"),
+            "errors": res.get("details") if not res.get("success") else None
+        }
+        if return_previous:
+            response["previous_files"] = previous_files
+        return dumps_json(response)
 
     except Exception as e:
         logger.error("upsert_lwc_component: %s", e, exc_info=True)
-        return json.dumps({"success": False, "error": str(e)}, indent=2)
+        return dumps_json({"success": False, "error": str(e)})
 
 
 
@@ -2153,54 +3108,202 @@ def upsert_lwc_component(
 # CUSTOM OBJECT TOOLS
 # =============================================================================
 
+# Custom API name: starts with a letter, letters/digits/underscores, ends with __c
+_CUSTOM_NAME_RE = re.compile(r"[A-Za-z][A-Za-z0-9_]*__c")
+
+def _add_length(f: Dict[str, Any], fd: Dict[str, Any]) -> None:
+    fd["length"] = f.get("length")
+
+
+def _add_precision_scale(f: Dict[str, Any], fd: Dict[str, Any]) -> None:
+    fd["precision"] = f.get("precision")
+    fd["scale"] = f.get("scale")
+
+
+def _add_reference(f: Dict[str, Any], fd: Dict[str, Any]) -> None:
+    fd["referenceTo"] = f.get("referenceTo", [])
+    fd["relationshipName"] = f.get("relationshipName")
+
+
+def _add_nothing(f: Dict[str, Any], fd: Dict[str, Any]) -> None:
+    pass
+
+
+# describe field type -> adds that type's extra attributes to a field summary
+_FIELD_EXTRACTORS: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], None]] = {
+    "text": _add_length,
+    "textarea": _add_length,
+    "number": _add_precision_scale,
+    "reference": _add_reference,
+}
+
+
+# Permission Set that upsert_custom_field grants new fields' FLS through
+_FLS_PS_Q = ("SELECT Id, Name, Label FROM PermissionSet "
+             "WHERE Label = 'System Admin' OR Name = 'System_Admin' LIMIT 1")
+# (instance, session_id) -> (permission set Id, current user Id)
+_fls_ids_cache = TTLCache(maxsize=32, ttl=1800)
+
+
+def _fls_state(
+    sf_connection, object_name: str, field_full: str, cached_ids: Optional[Tuple[str, str]]
+) -> Dict[str, Any]:
+    """Read what the FLS post-step needs in one REST composite request.
+
+    Returns `ps_id` / `me_id` (None if unresolved) and the PermissionSetAssignment
+    and FieldPermissions records as `psa` / `fp` lists, or None where the
+    sub-request failed (e.g. the Permission Set does not exist yet). With
+    `cached_ids`, the Permission Set and user lookups are skipped.
+    """
+    base = f"/services/data/v{_connection_api_version(sf_connection)}/"
+
+    def query_url(soql: str) -> str:
+        # Keep composite references (@{ref.field}) literal
+        return base + "query/?q=" + quote_plus(soql, safe="@{}[].")
+
+    requests_: List[Dict[str, str]] = []
+    if cached_ids:
+        ps_ref, me_ref = cached_ids
+    else:
+        ps_ref, me_ref = "@{ps.records[0].Id}", "@{me.id}"
+        requests_.append({"method": "GET", "url": query_url(_FLS_PS_Q), "referenceId": "ps"})
+        requests_.append({"method": "GET", "url": base + "chatter/users/me", "referenceId": "me"})
+    requests_.append({
+        "method": "GET",
+        "url": query_url(
+            f"SELECT Id FROM PermissionSetAssignment WHERE AssigneeId = '{me_ref}' "
+            f"AND PermissionSetId = '{ps_ref}' LIMIT 1"
+        ),
+        "referenceId": "psa",
+    })
+    requests_.append({
+        "method": "GET",
+        "url": query_url(
+            "SELECT Id, PermissionsRead, PermissionsEdit FROM FieldPermissions "
+            f"WHERE ParentId = '{ps_ref}' AND SobjectType = {_soql_quote(object_name)} "
+            f"AND Field = {_soql_quote(field_full)} LIMIT 1"
+        ),
+        "referenceId": "fp",
+    })
+
+    res = sf_connection.restful("composite", method="POST", json={"allOrNone": False, "compositeRequest": requests_})
+    subs = {sub.get("referenceId"): sub for sub in res.get("compositeResponse", [])}
+
+    def body(ref: str) -> Optional[Dict[str, Any]]:
+        sub = subs.get(ref) or {}
+        return (sub.get("body") or {}) if sub.get("httpStatusCode", 500) < 400 else None
+
+    if cached_ids:
+        ps_id, me_id = cached_ids
+    else:
+        ps_records = (body("ps") or {}).get("records") or []
+        ps_id = ps_records[0]["Id"] if ps_records else None
+        me_id = (body("me") or {}).get("id")
+    psa, fp = body("psa"), body("fp")
+    return {
+        "ps_id": ps_id,
+        "me_id": me_id,
+        "psa": psa.get("records", []) if psa is not None else None,
+        "fp": fp.get("records", []) if fp is not None else None,
+    }
+
+
+def _current_user_id(sf_connection) -> Optional[str]:
+    """Return the running user's Id (Chatter 'me' endpoint is reliable)."""
+    try:
+        return sf_connection.restful("chatter/users/me")["id"]
+    except Exception:
+        # Fallback: best-effort last-login user (not ideal, but avoids hard fail)
+        me_q = "SELECT Id FROM User WHERE IsActive = true ORDER BY LastLoginDate DESC NULLS LAST LIMIT 1"
+        me_res = sf_connection.query(me_q)
+        return me_res["records"][0]["Id"] if me_res.get("totalSize", 0) > 0 else None
+
+
+def _project_field(f: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact field summary for fetch_object_metadata: one dict literal plus
+    the type's extractor from `_FIELD_EXTRACTORS`."""
+    t = f["type"]
+    fd = {
+        "name": f["name"],
+        "label": f["label"],
+        "type": t,
+        "required": not f.get("nillable", True),
+        "custom": f.get("custom", False),
+    }
+    _FIELD_EXTRACTORS.get(t, _add_nothing)(f, fd)
+    return fd
+
+
+# NDJSON fetch_object_metadata output is cut off at the response token limit
+_NDJSON_MAX_CHARS = TOKEN_LIMIT * 4
+
+
+def _object_metadata_ndjson(header: Dict[str, Any], fields: List[Dict[str, Any]], field_offset: int) -> str:
+    """Render fetch_object_metadata as NDJSON: the header on the first line,
+    one field per line, then a `_metadata` trailer.
+
+    Every line is encoded once and its size counted as it is written, so the
+    size check needs no second serialization; fields past the token budget
+    are dropped and the trailer says where to resume.
+    """
+    lines = [dumps_json(header, pretty=False)]
+    size = len(lines[0])
+    returned = 0
+    for f in fields:
+        line = dumps_json(f, pretty=False)
+        if size + 1 + len(line) > _NDJSON_MAX_CHARS:
+            break
+        lines.append(line)
+        size += 1 + len(line)
+        returned += 1
+    lines.append(dumps_json({"_metadata": {
+        "returnedFields": returned,
+        "truncated": returned < len(fields),
+        "nextFieldOffset": field_offset + returned,
+        "estimated_tokens": size // 4,
+        "response_size_bytes": size,
+    }}, pretty=False))
+    return "\n".join(lines)
+
+
 @register_tool
-def fetch_object_metadata(object_name: str, max_fields: int = 100, field_offset: int = 0) -> str:
+def fetch_object_metadata(
+    object_name: str, max_fields: int = 100, field_offset: int = 0, ndjson: bool = False
+) -> str:
     """Return describe() + record type info for any object.
 
     Args:
         object_name: API name of the object
         max_fields: Maximum number of fields to return (default: 100, use 0 for all)
         field_offset: Starting position for field pagination (default: 0)
+        ndjson: Return newline-delimited JSON instead: the object summary and
+            record types on the first line, one field per line, then a
+            `_metadata` line (default: False). Suited to wide objects.
     """
     try:
         sf = get_salesforce_connection()
-        desc = getattr(sf, object_name).describe()
+        # The RecordType query does not depend on the describe; overlap them
+        rt_future = _preflight_pool.submit(
+            sf.query,
+            f"SELECT Id, Name, DeveloperName, IsActive FROM RecordType WHERE SobjectType = {_soql_quote(object_name)}",
+        )
+        # Cached: paging through fields with field_offset re-uses one describe
+        desc = _describe_sobject(sf, object_name)
     except Exception:
-        return json.dumps({"success": False, "error": f"{object_name} not found"}, indent=2)
+        return dumps_json({"success": False, "error": f"{object_name} not found"})
 
-    all_fields = desc["fields"]
+    all_fields = _projected_fields(sf, object_name, desc)
     total_field_count = len(all_fields)
 
     # Apply pagination to fields
     if max_fields > 0:
-        fields_to_process = all_fields[field_offset:field_offset + max_fields]
+        fields = all_fields[field_offset:field_offset + max_fields]
     else:
-        fields_to_process = all_fields[field_offset:]
-
-    fields = []
-    for f in fields_to_process:
-        fd = {
-            "name": f["name"],
-            "label": f["label"],
-            "type": f["type"],
-            "required": not f.get("nillable", True),
-            "custom": f.get("custom", False),
-        }
-        if f["type"] in {"text", "textarea"}:
-            fd["length"] = f.get("length")
-        if f["type"] == "number":
-            fd["precision"] = f.get("precision")
-            fd["scale"] = f.get("scale")
-        if f["type"] == "reference":
-            fd["referenceTo"] = f.get("referenceTo", [])
-            fd["relationshipName"] = f.get("relationshipName")
-        fields.append(fd)
+        fields = all_fields[field_offset:]
 
     record_types = []
     try:
-        rts = sf.query(
-            f"SELECT Id, Name, DeveloperName, IsActive FROM RecordType WHERE SobjectType = '{object_name}'"
-        )
+        rts = rt_future.result()
         record_types = [
             {
                 "id": rt["Id"],
@@ -2225,10 +3328,83 @@ def fetch_object_metadata(object_name: str, max_fields: int = 100, field_offset:
         "fields": fields,
         "recordTypes": record_types,
     }
+    if ndjson:
+        header = {k: v for k, v in response.items() if k != "fields"}
+        return _object_metadata_ndjson(header, fields, field_offset)
 
     # Check response size and add warnings if needed
     response = ResponseSizeManager.check_response_size(response)
-    return json.dumps(response, indent=2)
+    return dumps_json(response)
+
+
+@register_tool
+def fetch_objects_metadata(object_names: List[str], max_fields: int = 100) -> str:
+    """Return describe() summaries + record types for several objects at once.
+
+    Uncached objects are described through the composite batch API (up to 25
+    per request) and record types come from one `SobjectType IN (...)` query,
+    so a related-objects schema lookup costs a couple of round-trips instead
+    of two per object.
+
+    Args:
+        object_names: API names of the objects
+        max_fields: Maximum number of fields per object (default: 100, use 0 for all)
+    """
+    names = list(dict.fromkeys(n for n in object_names if n))
+    if not names:
+        return dumps_json({"success": False, "error": "object_names is empty"})
+    bad = [n for n in names if not _FIELD_NAME_RE.match(n)]
+    if bad:
+        return dumps_json({"success": False, "error": f"Invalid object name(s): {', '.join(bad)}"})
+
+    try:
+        sf = get_salesforce_connection()
+        described = _describe_many(sf, names)
+
+        found = [n for n, d in described.items() if d is not None]
+        record_types: Dict[str, List[Dict[str, Any]]] = {}
+        try:
+            rts = sf.query_all(
+                "SELECT Id, Name, DeveloperName, IsActive, SobjectType FROM RecordType "
+                f"WHERE SobjectType IN ({', '.join(_soql_quote(n) for n in found)})"
+            ) if found else {}
+            for rt in rts.get("records", []):
+                record_types.setdefault(rt["SobjectType"], []).append({
+                    "id": rt["Id"],
+                    "name": rt["Name"],
+                    "developerName": rt["DeveloperName"],
+                    "isActive": rt["IsActive"],
+                })
+        except Exception:
+            pass
+
+        objects: Dict[str, Any] = {}
+        for name, desc in described.items():
+            if desc is None:
+                continue
+            all_fields = _projected_fields(sf, name, desc)
+            fields = all_fields[:max_fields] if max_fields > 0 else all_fields
+            objects[name] = {
+                "label": desc["label"],
+                "isCustom": desc["custom"],
+                "totalFields": len(all_fields),
+                "returnedFields": len(fields),
+                "hasMoreFields": len(fields) < len(all_fields),
+                "fields": fields,
+                "recordTypes": record_types.get(name, []),
+            }
+
+        response = {
+            "success": True,
+            "objects": objects,
+            "notFound": [n for n, d in described.items() if d is None],
+        }
+        response = ResponseSizeManager.check_response_size(response)
+        return dumps_json(response)
+
+    except Exception as e:
+        logger.error("fetch_objects_metadata: %s", e, exc_info=True)
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -2335,41 +3511,38 @@ Examples:
         sf = get_salesforce_connection()
         if not object_name.endswith("__c"):
             object_name += "__c"
-        if not object_name[:-3].replace("_", "").isalnum():
-            return json.dumps(
-                {"success": False, "error": "Invalid object name"}, indent=2
-            )
+        if _CUSTOM_NAME_RE.fullmatch(object_name) is None:
+            return dumps_json({"success": False, "error": "Invalid object name"})
 
         # Build the XML
         custom_object_xml = _generate_custom_object_xml(
             label, plural_label, description, sharing_model
         )
 
-        api_ver = getattr(sf, "sf_version", "59.0")
-        pkg_xml = _generate_package_xml([object_name], "CustomObject", api_ver)
+        api_ver = getattr(sf, "sf_version", _DEFAULT_API_VERSION)
 
         # Zip
-        buf = io.BytesIO()
-        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as z:
-            z.writestr("package.xml", pkg_xml)
-            z.writestr(f"objects/{object_name}.object", custom_object_xml)
-        buf.seek(0)
+        buf = _zip_package([
+            ("package.xml", _cached_package_xml((object_name,), "CustomObject", api_ver)),
+            (f"objects/{object_name}.object", custom_object_xml),
+        ])
 
         dep = _execute_metadata_rest_deploy_multipart(sf, buf)
         status = _poll_metadata_rest_deploy_status(sf, dep["id"])
+        _invalidate_describe(sf, object_name)
+        _global_sobjects_cache.pop(_session_key(sf))
 
-        return json.dumps(
+        return dumps_json(
             {
                 "success": status["success"],
                 "job_id": dep["id"],
                 "status": status["status"],
                 "details": status.get("details"),
-            },
-            indent=2,
+            }
         )
     except Exception as e:
         logger.error("upsert_custom_object: %s", e, exc_info=True)
-        return json.dumps({"success": False, "error": str(e)}, indent=2)
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # =============================================================================
@@ -2402,8 +3575,8 @@ Notes & caveats:
   `FieldDefinition` rows often exist per particle (e.g., `BillingStreet`).
 - **Picklists**: This function does not expand full value sets. Use a separate
   helper if you need the concrete picklist values.
-- **Safety**: The Tooling SOQL uses string interpolation. Prefer a small
-  quoting helper (e.g., `soql_quote()`) to avoid broken queries.
+- **Safety**: Names are bound into the Tooling SOQL via `_soql_quote()`, and the
+  query runs concurrently with the (cached) describe.
 
 Args:
     object_name (str): The sObject API name that owns the field.
@@ -2453,25 +3626,56 @@ Typical usage:
     try:
         sf = get_salesforce_connection()
 
-        desc = getattr(sf, object_name).describe()
-        field = next((f for f in desc["fields"] if f["name"] == field_name), None)
-        if not field:
-            return json.dumps({"success": False, "error": "Field not found"}, indent=2)
-
+        # The FieldDefinition query does not depend on the describe; overlap them
         tooling_q = (
             "SELECT Id, DurableId, DataType, Precision, Scale, Length "
-            f"FROM FieldDefinition WHERE EntityDefinition.QualifiedApiName = '{object_name}' "
-            f"AND QualifiedApiName = '{field_name}'"
+            f"FROM FieldDefinition WHERE EntityDefinition.QualifiedApiName = {_soql_quote(object_name)} "
+            f"AND QualifiedApiName = {_soql_quote(field_name)}"
         )
-        tooling_res = sf.toolingexecute(f"query/?q={tooling_q}")
+        tooling_future = _preflight_pool.submit(_tooling_query, sf, tooling_q)
+
+        field = _sobject_field_index(sf, object_name).get(field_name)
+        if not field:
+            tooling_future.cancel()
+            return dumps_json({"success": False, "error": "Field not found"})
+        # The describe is shared with the cache; copy before dropping `attributes`
+        field = {k: v for k, v in field.items() if k != "attributes"}
+
+        tooling_res = tooling_future.result()
         extra = tooling_res["records"][0] if tooling_res.get("records") else {}
 
-        field.pop("attributes", None)
-        return json.dumps({"success": True, "field": field, "extra": extra}, indent=2)
+        return dumps_json({"success": True, "field": field, "extra": extra})
 
     except Exception as e:
         logger.error("fetch_custom_field: %s", e, exc_info=True)
-        return json.dumps({"success": False, "error": str(e)}, indent=2)
+        return dumps_json({"success": False, "error": str(e)})
+
+# upsert_custom_field type_params parsing
+_KV_SPLIT_RE = re.compile(r"[;,]\s*")
+_PICKLIST_SPLIT_RE = re.compile(r"[|,]")
+
+
+def _coerce_type_param(v: str) -> Any:
+    """Coerce a type_params value: "true"/"false" -> bool, "-12" -> int,
+    "1.5" -> float, anything else stays a string. One pass, no regex."""
+    if not v:
+        return v
+    c = v[0]
+    if c == "-" or c.isdecimal():
+        digits = v[1:] if c == "-" else v
+        if digits.isdecimal():
+            return int(v)
+        head, dot, tail = digits.partition(".")
+        if dot and head.isdecimal() and tail.isdecimal():
+            return float(v)
+        return v
+    lv = v.lower()
+    if lv == "true":
+        return True
+    if lv == "false":
+        return False
+    return v
+
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
 # @register_tool
@@ -2587,15 +3791,12 @@ def upsert_custom_field(
     upsert_custom_field("Ticket__c", "Account__c", "Account", "Lookup",
                                "referenceTo=Account;relationshipName=TicketAccount;relationshipLabel=Account")
     """
-    import io, json, zipfile, re
-    from typing import Any, Dict
-
     def _parse_kv(s: str) -> Dict[str, Any]:
         out: Dict[str, Any] = {}
         if not s:
             return out
         # split by ; or , pairs -> key=value
-        for pair in re.split(r"[;,]\s*", s.strip()):
+        for pair in _KV_SPLIT_RE.split(s.strip()):
             if not pair:
                 continue
             if "=" not in pair:
@@ -2605,20 +3806,7 @@ def upsert_custom_field(
             k, v = pair.split("=", 1)
             k = k.strip()
             v = v.strip()
-            # coerce bools/ints if look like them
-            if v.lower() in ("true", "false"):
-                out[k] = (v.lower() == "true")
-            else:
-                # numbers
-                if re.fullmatch(r"-?\d+", v):
-                    out[k] = int(v)
-                elif re.fullmatch(r"-?\d+\.\d+", v):
-                    try:
-                        out[k] = float(v)
-                    except Exception:
-                        out[k] = v
-                else:
-                    out[k] = v
+            out[k] = _coerce_type_param(v)
         return out
 
     def _normalize_object_name(o: str) -> str:
@@ -2629,10 +3817,7 @@ def upsert_custom_field(
 
     def _valid_custom_name(n: str) -> bool:
         # must end with __c and contain only letters/numbers/underscores; start with a letter
-        if not n.endswith("__c"):
-            return False
-        core = n[:-3]
-        return bool(core) and core[0].isalpha() and core.replace("_","").isalnum()
+        return _CUSTOM_NAME_RE.fullmatch(n) is not None
 
     def _build_field_config() -> Dict[str, Any]:
         cfg: Dict[str, Any] = {
@@ -2665,10 +3850,10 @@ def upsert_custom_field(
         elif ft == "picklist":
             vals_raw = tp.get("values", "")
             if isinstance(vals_raw, str):
-                items = [v.strip() for v in re.split(r"[|,]", vals_raw) if v.strip()]
+                items = [v.strip() for v in _PICKLIST_SPLIT_RE.split(vals_raw) if v.strip()]
             else:
                 items = []
-            # Convert to the format expected by _generate_custom_field_xml
+            # Convert to the format expected by _generate_custom_object_with_field
             cfg["picklistValues"] = [{"fullName": item, "label": item, "default": False} for item in items]
             cfg["type"] = "Picklist"
         elif ft in ("lookup","masterdetail","master-detail"):
@@ -2697,49 +3882,43 @@ def upsert_custom_field(
 
         # ---- Validate names ----
         if not _valid_custom_name(field_name):
-            return json.dumps({"success": False, "error": "Invalid field API name (must end with __c, start with a letter, contain only letters/numbers/underscores)."}, indent=2)
+            return dumps_json({"success": False, "error": "Invalid field API name (must end with __c, start with a letter, contain only letters/numbers/underscores)."})
         # object must be custom unless standard allowed
         if not (object_name in {"Account","Contact","Lead","Opportunity","Case"} or _valid_custom_name(object_name)):
-            return json.dumps({"success": False, "error": "Invalid object API name."}, indent=2)
+            return dumps_json({"success": False, "error": "Invalid object API name."})
 
-        # ---- Object existence check (describe) ----
+        # ---- Object existence check (cached describe) ----
         try:
-            desc = getattr(sf, object_name).describe()
+            fields_by_name = _sobject_field_index(sf, object_name)
         except Exception:
-            return json.dumps({"success": False, "error": f"Object not found: {object_name}"}, indent=2)
+            return dumps_json({"success": False, "error": f"Object not found: {object_name}"})
 
-        # ---- Field existence check (describe fields) ----
-        existing_field = next((f for f in desc.get("fields", []) if f.get("name") == field_name), None)
-        is_update = existing_field is not None
+        # ---- Field existence check (O(1) on the cached field index) ----
+        is_update = field_name in fields_by_name
 
         # ---- Build field config from simple params ----
         field_config: Dict[str, Any] = _build_field_config()
 
         # ---- Generate XML & package ----
-        field_xml = _generate_custom_field_xml(field_config)
-
-        api_ver = getattr(sf, "sf_version", "59.0")
+        api_ver = getattr(sf, "sf_version", _DEFAULT_API_VERSION)
         member_name = f"{object_name}.{field_name}"
 
         # ✅ Deploy a field, not the whole object (avoids label/pluralLabel requirements)
-        pkg_xml = _generate_package_xml([member_name], "CustomField", api_ver)
+        # MDAPI still expects the field inside the object’s metadata file
+        buf = _zip_package([
+            ("package.xml", _cached_package_xml((member_name,), "CustomField", api_ver)),
+            (f"objects/{object_name}.object", lambda: _generate_custom_object_with_field(object_name, field_config)),
+        ])
 
-        buf = io.BytesIO()
-        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as z:
-             z.writestr("package.xml", pkg_xml)
-             # MDAPI still expects the field inside the object’s metadata file
-             obj_xml = _generate_custom_object_with_field(object_name, field_config)
-             z.writestr(f"objects/{object_name}.object", obj_xml)
- 
         # ---- Actual deploy ----
-        buf.seek(0)
         deploy = _execute_metadata_rest_deploy_multipart(sf, buf, check_only=False)
-        final_status = _poll_metadata_rest_deploy_status(sf, deploy["id"])
+        final_status = _poll_metadata_rest_deploy_status(sf, deploy["id"], details_on_success=False)
+        _invalidate_describe(sf, object_name)
         op = "update_custom_field" if is_update else "create_custom_field"
 
         # Short-circuit on deploy failure (skip FLS work if field didn't deploy)
         if not final_status.get("success"):
-            return json.dumps({
+            return dumps_json({
                 "success": False,
                 "operation": op,
                 "object_name": object_name,
@@ -2748,52 +3927,60 @@ def upsert_custom_field(
                 "job_id": deploy["id"],
                 "message": "Field deployment failed",
                 "errors": final_status.get("details")
-            }, indent=2)
+            })
 
         # ---- Post-step: Ensure FLS via Permission Set "System Admin" ----
         fls_result = {"permission_set_id": None, "assigned_to_me": False, "field_permissions_id": None}
+        field_full = f"{object_name}.{field_name}"
+        fls_key = _session_key(sf)
         try:
+            # All reads in one composite round-trip; anything it could not
+            # answer (None) falls back to the individual query below.
+            try:
+                state = _fls_state(sf, object_name, field_full, _fls_ids_cache.get(fls_key))
+            except Exception as comp_err:
+                logger.debug("FLS composite lookup failed, using individual queries: %s", comp_err)
+                state = {"ps_id": None, "me_id": None, "psa": None, "fp": None}
+
             # 1) Find or create Permission Set (Label='System Admin')
-            ps_q = ("SELECT Id, Name, Label FROM PermissionSet "
-                    "WHERE Label = 'System Admin' OR Name = 'System_Admin' LIMIT 1")
-            ps_res = sf.query(ps_q)
-            if ps_res.get("totalSize", 0) == 0:
-                # Create it
-                created = sf.PermissionSet.create({
-                    "Name": "System_Admin",
-                    "Label": "System Admin",
-                    "Description": "Auto-created by tool for field-level access",
-                    "HasActivationRequired": False
-                })
-                ps_id = created.get("id")
-            else:
-                ps_id = ps_res["records"][0]["Id"]
+            ps_id = state["ps_id"]
+            if not ps_id:
+                ps_res = sf.query(_FLS_PS_Q)
+                if ps_res.get("totalSize", 0) == 0:
+                    # Create it
+                    created = sf.PermissionSet.create({
+                        "Name": "System_Admin",
+                        "Label": "System Admin",
+                        "Description": "Auto-created by tool for field-level access",
+                        "HasActivationRequired": False
+                    })
+                    ps_id = created.get("id")
+                else:
+                    ps_id = ps_res["records"][0]["Id"]
             fls_result["permission_set_id"] = ps_id
 
-            # 2) Get current user id (Chatter 'me' endpoint is reliable)
-            try:
-                me = sf.restful("chatter/users/me")
-                me_id = me["id"]
-            except Exception:
-                # Fallback: best-effort last-login user (not ideal, but avoids hard fail)
-                me_q = "SELECT Id FROM User WHERE IsActive = true ORDER BY LastLoginDate DESC NULLS LAST LIMIT 1"
-                me_res = sf.query(me_q)
-                me_id = me_res["records"][0]["Id"] if me_res.get("totalSize", 0) > 0 else None
+            # 2) Current user id
+            me_id = state["me_id"] or _current_user_id(sf)
 
             # 3) Assign PS to current user if not already
             if me_id:
-                chk_q = f"SELECT Id FROM PermissionSetAssignment WHERE AssigneeId = '{me_id}' AND PermissionSetId = '{ps_id}' LIMIT 1"
-                chk = sf.query(chk_q)
-                if chk.get("totalSize", 0) == 0:
+                psa = state["psa"]
+                if psa is None:
+                    chk_q = f"SELECT Id FROM PermissionSetAssignment WHERE AssigneeId = '{me_id}' AND PermissionSetId = '{ps_id}' LIMIT 1"
+                    psa = sf.query(chk_q).get("records", [])
+                if not psa:
                     sf.PermissionSetAssignment.create({"AssigneeId": me_id, "PermissionSetId": ps_id})
                 fls_result["assigned_to_me"] = True if me_id else False
+                _fls_ids_cache.set(fls_key, (ps_id, me_id))
 
             # 4) Grant FieldPermissions (read+edit) for the field on that PS
-            field_full = f"{object_name}.{field_name}"
-            fp_q = ("SELECT Id, PermissionsRead, PermissionsEdit FROM FieldPermissions "
-                    f"WHERE ParentId = '{ps_id}' AND SobjectType = '{object_name}' AND Field = '{field_full}' LIMIT 1")
-            fp = sf.query(fp_q)
-            if fp.get("totalSize", 0) == 0:
+            fp_records = state["fp"]
+            if fp_records is None:
+                fp_q = ("SELECT Id, PermissionsRead, PermissionsEdit FROM FieldPermissions "
+                        f"WHERE ParentId = '{ps_id}' AND SobjectType = {_soql_quote(object_name)} "
+                        f"AND Field = {_soql_quote(field_full)} LIMIT 1")
+                fp_records = sf.query(fp_q).get("records", [])
+            if not fp_records:
                 created_fp = sf.FieldPermissions.create({
                     "ParentId": ps_id,
                     "SobjectType": object_name,
@@ -2803,14 +3990,17 @@ def upsert_custom_field(
                 })
                 fls_result["field_permissions_id"] = created_fp.get("id")
             else:
-                fp_id = fp["records"][0]["Id"]
-                # Ensure both perms are true
-                sf.FieldPermissions.update(fp_id, {"PermissionsRead": True, "PermissionsEdit": True})
-                fls_result["field_permissions_id"] = fp_id
+                fp = fp_records[0]
+                # Ensure both perms are true; an existing field usually has them already
+                if not (fp.get("PermissionsRead") and fp.get("PermissionsEdit")):
+                    sf.FieldPermissions.update(fp["Id"], {"PermissionsRead": True, "PermissionsEdit": True})
+                fls_result["field_permissions_id"] = fp["Id"]
 
         except Exception as fls_err:
+            # Cached Ids may be stale (e.g. Permission Set deleted); re-resolve next time
+            _fls_ids_cache.pop(fls_key)
             # Don’t fail the whole operation—surface the FLS error context.
-            return json.dumps({
+            return dumps_json({
                 "success": True,  # field deployed successfully
                 "operation": op,
                 "object_name": object_name,
@@ -2820,10 +4010,10 @@ def upsert_custom_field(
                 "message": f"Field deployed, but FLS grant step encountered an error: {fls_err}",
                 "errors": None,
                 "fls_grant": fls_result
-            }, indent=2)
+            })
 
         # ---- Done ----
-        return json.dumps({
+        return dumps_json({
             "success": True,
             "operation": op,
             "object_name": object_name,
@@ -2834,11 +4024,11 @@ def upsert_custom_field(
                         "and granted read/edit via 'System Admin' Permission Set"),
             "errors": None,
             "fls_grant": fls_result
-        }, indent=2)
+        })
 
     except Exception as e:
         logger.error("upsert_custom_field error: %s", e, exc_info=True)
-        return json.dumps({"success": False, "error": str(e)}, indent=2)
+        return dumps_json({"success": False, "error": str(e)})
 
 # =============================================================================
 # SOQL QUERY EXECUTION TOOL
@@ -2899,12 +4089,12 @@ Examples:
         try:
             validate_soql_query(query)
         except ValidationError as ve:
-            return json.dumps({"success": False, "error": f"Invalid SOQL query: {str(ve)}"}, indent=2)
+            return dumps_json({"success": False, "error": f"Invalid SOQL query: {str(ve)}"})
 
         sf = get_salesforce_connection()
 
         # Clean up the query - remove extra whitespace and ensure proper formatting
-        clean_query = ' '.join(query.strip().split())
+        clean_query = _norm_ws(query)
         
         if use_tooling_api:
             # Use Tooling API for metadata queries
@@ -2914,28 +4104,28 @@ Examples:
             result = sf.query(clean_query)
         
         # Clean up the response - remove attributes and format nicely
-        if result.get("records"):
-            for record in result["records"]:
-                record.pop("attributes", None)
-                # Also clean nested objects
-                for key, value in record.items():
-                    if isinstance(value, dict) and "attributes" in value:
-                        value.pop("attributes", None)
-        
-        return json.dumps({
+        records = result.get("records") or []
+        for record in records:
+            record.pop("attributes", None)
+            # Also clean nested objects (simple_salesforce decodes them as OrderedDict)
+            for value in record.values():
+                if isinstance(value, dict):
+                    value.pop("attributes", None)
+
+        return dumps_json({
             "success": True, 
             "totalSize": result.get("totalSize", 0),
             "done": result.get("done", True),
-            "records": result.get("records", [])
-        }, indent=2)
+            "records": records
+        })
         
     except Exception as e:
         logger.error("execute_soql_query error: %s", e, exc_info=True)
-        return json.dumps({
+        return dumps_json({
             "success": False, 
             "error": str(e),
             "query": query
-        }, indent=2)
+        })
 
 # =============================================================================
 # APEX / LWC DEPLOY INTERNALS
@@ -2945,25 +4135,15 @@ def deploy_apex_class_internal(
     sf_connection, class_name: str, files_content: Dict[str, str], api_version: str
 ) -> Dict[str, Any]:
     """Deploy Apex class via REST Metadata."""
-    pkg_xml = _generate_package_xml([class_name], "ApexClass", api_version)
-
-    PNS = "http://soap.sforce.com/2006/04/metadata"
-    root = etree.Element(etree.QName(PNS, "ApexClass"), nsmap={None: PNS})
-    etree.SubElement(root, etree.QName(PNS, "apiVersion")).text = str(api_version)
-    etree.SubElement(root, etree.QName(PNS, "status")).text = "Active"
-    meta_xml = etree.tostring(
-        root, encoding="UTF-8", pretty_print=True, xml_declaration=True
-    ).decode()
-
-    buf = io.BytesIO()
-    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as z:
-        z.writestr("package.xml", pkg_xml)
-        z.writestr(f"classes/{class_name}.cls", files_content["apex"])
-        z.writestr(f"classes/{class_name}.cls-meta.xml", meta_xml)
-    buf.seek(0)
+    buf = _zip_package([
+        ("package.xml", lambda: _generate_package_xml([class_name], "ApexClass", api_version)),
+        (f"classes/{class_name}.cls", files_content["apex"]),
+        (f"classes/{class_name}.cls-meta.xml", lambda: _generate_apex_meta_xml("ApexClass", api_version)),
+    ])
 
     dep = _execute_metadata_rest_deploy_multipart(sf_connection, buf)
-    status = _poll_metadata_rest_deploy_status(sf_connection, dep["id"])
+    status = _poll_metadata_rest_deploy_status(sf_connection, dep["id"], details_on_success=False)
+    _apex_body_cache.pop((getattr(sf_connection, "sf_instance", None), class_name))
     # Normalize success strictly from terminal deploy status
     success_flag = str(status.get("status", "")).lower() == "succeeded"
     status["job_id"] = dep["id"]
@@ -2974,25 +4154,32 @@ def deploy_apex_trigger_internal(
     sf_connection, trigger_name: str, table_name: str, files_content: Dict[str, str], api_version: str
 ) -> Dict[str, Any]:
     """Deploy Apex trigger via REST Metadata."""
-    pkg_xml = _generate_package_xml([trigger_name], "ApexTrigger", api_version)
+    return deploy_apex_triggers_internal(
+        sf_connection, [(trigger_name, files_content["apex"], api_version)]
+    )
 
-    PNS = "http://soap.sforce.com/2006/04/metadata"
-    root = etree.Element(etree.QName(PNS, "ApexTrigger"), nsmap={None: PNS})
-    etree.SubElement(root, etree.QName(PNS, "apiVersion")).text = str(api_version)
-    etree.SubElement(root, etree.QName(PNS, "status")).text = "Active"
-    meta_xml = etree.tostring(
-        root, encoding="UTF-8", pretty_print=True, xml_declaration=True
-    ).decode()
 
-    buf = io.BytesIO()
-    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as z:
-        z.writestr("package.xml", pkg_xml)
-        z.writestr(f"triggers/{trigger_name}.trigger", files_content["apex"])
-        z.writestr(f"triggers/{trigger_name}.trigger-meta.xml", meta_xml)
-    buf.seek(0)
+def deploy_apex_triggers_internal(
+    sf_connection, triggers: List[Tuple[str, str, str]]
+) -> Dict[str, Any]:
+    """Deploy one or more Apex triggers as a single REST Metadata package.
+
+    `triggers` holds (name, body, api_version) tuples; the package version is
+    the highest requested API version.
+    """
+    package_version = max((v for _, _, v in triggers), key=float)
+    entries: List[PackageEntry] = [
+        ("package.xml", lambda: _generate_package_xml([n for n, _, _ in triggers], "ApexTrigger", package_version)),
+    ]
+    for name, body, version in triggers:
+        entries.append((f"triggers/{name}.trigger", body))
+        entries.append((f"triggers/{name}.trigger-meta.xml", _generate_apex_meta_xml("ApexTrigger", version)))
+    buf = _zip_package(entries)
 
     dep = _execute_metadata_rest_deploy_multipart(sf_connection, buf)
-    status = _poll_metadata_rest_deploy_status(sf_connection, dep["id"])
+    status = _poll_metadata_rest_deploy_status(sf_connection, dep["id"], details_on_success=False)
+    for name, _, _ in triggers:
+        _invalidate_trigger(sf_connection, name)
     # Normalize success strictly from terminal deploy status
     success_flag = str(status.get("status", "")).lower() == "succeeded"
     status["job_id"] = dep["id"]
@@ -3004,7 +4191,7 @@ def deploy_validation_rule_internal(
     error_message: str, error_display_field: str, description: str, active: bool
 ) -> Dict[str, Any]:
     """Deploy ValidationRule via REST Metadata."""
-    api_version = getattr(sf_connection, "sf_version", "59.0")
+    api_version = getattr(sf_connection, "sf_version", _DEFAULT_API_VERSION)
     member_name = f"{object_name}.{rule_name}"
     pkg_xml = _generate_package_xml([member_name], "ValidationRule", api_version)
 
@@ -3032,7 +4219,7 @@ def deploy_validation_rule_internal(
     buf.seek(0)
 
     dep = _execute_metadata_rest_deploy_multipart(sf_connection, buf)
-    status = _poll_metadata_rest_deploy_status(sf_connection, dep["id"])
+    status = _poll_metadata_rest_deploy_status(sf_connection, dep["id"], details_on_success=False)
     # Normalize success strictly from terminal deploy status
     success_flag = str(status.get("status", "")).lower() == "succeeded"
     status["job_id"] = dep["id"]
@@ -3043,24 +4230,22 @@ def deploy_lwc_component_internal(
     sf_connection, component_name: str, files_content: Dict[str, str]
 ) -> Dict[str, Any]:
     """Deploy an LWC bundle."""
-    api_version = getattr(sf_connection, "sf_version", "59.0")
-    pkg_xml = _generate_package_xml([component_name], "LightningComponentBundle", api_version)
-
+    api_version = _connection_api_version(sf_connection)
     base = f"lwc/{component_name}/"
-    buf = io.BytesIO()
-    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as z:
-        z.writestr("package.xml", pkg_xml)
-        z.writestr(f"{base}{component_name}.html", files_content["html"])
-        z.writestr(f"{base}{component_name}.js", files_content["js"])
-        z.writestr(f"{base}{component_name}.js-meta.xml", files_content["xml"])
-        if files_content.get("css"):
-            z.writestr(f"{base}{component_name}.css", files_content["css"])
-        if files_content.get("svg"):
-            z.writestr(f"{base}{component_name}.svg", files_content["svg"])
-    buf.seek(0)
+    entries: List[PackageEntry] = [
+        ("package.xml", lambda: _generate_package_xml([component_name], "LightningComponentBundle", api_version)),
+        (f"{base}{component_name}.html", files_content["html"]),
+        (f"{base}{component_name}.js", files_content["js"]),
+        (f"{base}{component_name}.js-meta.xml", files_content["xml"]),
+    ]
+    if files_content.get("css"):
+        entries.append((f"{base}{component_name}.css", files_content["css"]))
+    if files_content.get("svg"):
+        entries.append((f"{base}{component_name}.svg", files_content["svg"]))
+    buf = _zip_package(entries)
 
     dep = _execute_metadata_rest_deploy_multipart(sf_connection, buf)
-    status = _poll_metadata_rest_deploy_status(sf_connection, dep["id"])
+    status = _poll_metadata_rest_deploy_status(sf_connection, dep["id"], details_on_success=False)
     # Normalize success strictly from terminal deploy status
     success_flag = str(status.get("status", "")).lower() == "succeeded"
     status["job_id"] = dep["id"]
@@ -3086,7 +4271,7 @@ def fetch_flow(flow_name: str) -> str:
         response = sf.toolingexecute(f"query/?q={query}")
 
         if not response.get("records"):
-            return json.dumps({"success": False, "error": f"Flow '{flow_name}' not found"})
+            return dumps_json({"success": False, "error": f"Flow '{flow_name}' not found"})
 
         flow_def = response["records"][0]
 
@@ -3100,10 +4285,10 @@ def fetch_flow(flow_name: str) -> str:
             "activeVersion": version_response.get("records", [None])[0] if version_response.get("records") else None
         }
 
-        return json.dumps(result, indent=2)
+        return dumps_json(result)
     except Exception as e:
         logger.exception("fetch_flow failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -3128,7 +4313,7 @@ def create_flow(
     """
     try:
         sf = get_salesforce_connection()
-        api_version = getattr(sf, "sf_version", "59.0")
+        api_version = getattr(sf, "sf_version", _DEFAULT_API_VERSION)
 
         # Generate Flow XML
         PNS = "http://soap.sforce.com/2006/04/metadata"
@@ -3161,10 +4346,10 @@ def create_flow(
         status = _poll_metadata_rest_deploy_status(sf, dep["id"])
         status["job_id"] = dep["id"]
 
-        return json.dumps(status, indent=2)
+        return dumps_json(status)
     except Exception as e:
         logger.exception("create_flow failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -3181,7 +4366,7 @@ def upsert_flow(
     """
     try:
         # Check if flow exists
-        result = json.loads(fetch_flow(flow_name))
+        result = loads_json(fetch_flow(flow_name))
         exists = result.get("success", False)
 
         if exists:
@@ -3190,7 +4375,7 @@ def upsert_flow(
         return create_flow(flow_name, label, process_type, description)
     except Exception as e:
         logger.exception("upsert_flow failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # =============================================================================
@@ -3214,7 +4399,7 @@ def fetch_email_template(template_name: str, folder_name: str = "unfiled$public"
         response = sf.query(query)
 
         if not response.get("records"):
-            return json.dumps({"success": False, "error": f"Email template '{template_name}' not found"})
+            return dumps_json({"success": False, "error": f"Email template '{template_name}' not found"})
 
         template = response["records"][0]
 
@@ -3223,10 +4408,10 @@ def fetch_email_template(template_name: str, folder_name: str = "unfiled$public"
             "template": template
         }
 
-        return json.dumps(result, indent=2)
+        return dumps_json(result)
     except Exception as e:
         logger.exception("fetch_email_template failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -3255,7 +4440,7 @@ def create_email_template(
     """
     try:
         sf = get_salesforce_connection()
-        api_version = getattr(sf, "sf_version", "59.0")
+        api_version = getattr(sf, "sf_version", _DEFAULT_API_VERSION)
 
         # Generate EmailTemplate XML
         PNS = "http://soap.sforce.com/2006/04/metadata"
@@ -3287,10 +4472,10 @@ def create_email_template(
         status = _poll_metadata_rest_deploy_status(sf, dep["id"])
         status["job_id"] = dep["id"]
 
-        return json.dumps(status, indent=2)
+        return dumps_json(status)
     except Exception as e:
         logger.exception("create_email_template failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -3313,7 +4498,7 @@ def upsert_email_template(
         )
     except Exception as e:
         logger.exception("upsert_email_template failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # =============================================================================
@@ -3335,7 +4520,7 @@ def fetch_permission_set(permission_set_name: str) -> str:
         response = sf.query(query)
 
         if not response.get("records"):
-            return json.dumps({"success": False, "error": f"Permission Set '{permission_set_name}' not found"})
+            return dumps_json({"success": False, "error": f"Permission Set '{permission_set_name}' not found"})
 
         perm_set = response["records"][0]
 
@@ -3344,10 +4529,10 @@ def fetch_permission_set(permission_set_name: str) -> str:
             "permissionSet": perm_set
         }
 
-        return json.dumps(result, indent=2)
+        return dumps_json(result)
     except Exception as e:
         logger.exception("fetch_permission_set failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -3368,7 +4553,7 @@ def create_permission_set(
     """
     try:
         sf = get_salesforce_connection()
-        api_version = getattr(sf, "sf_version", "59.0")
+        api_version = getattr(sf, "sf_version", _DEFAULT_API_VERSION)
 
         # Generate PermissionSet XML
         PNS = "http://soap.sforce.com/2006/04/metadata"
@@ -3394,10 +4579,10 @@ def create_permission_set(
         status = _poll_metadata_rest_deploy_status(sf, dep["id"])
         status["job_id"] = dep["id"]
 
-        return json.dumps(status, indent=2)
+        return dumps_json(status)
     except Exception as e:
         logger.exception("create_permission_set failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -3413,7 +4598,7 @@ def upsert_permission_set(
         return create_permission_set(permission_set_name, label, description, has_activation_required)
     except Exception as e:
         logger.exception("upsert_permission_set failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # =============================================================================
@@ -3435,7 +4620,7 @@ def fetch_static_resource(resource_name: str) -> str:
         response = sf.query(query)
 
         if not response.get("records"):
-            return json.dumps({"success": False, "error": f"Static Resource '{resource_name}' not found"})
+            return dumps_json({"success": False, "error": f"Static Resource '{resource_name}' not found"})
 
         resource = response["records"][0]
 
@@ -3444,10 +4629,10 @@ def fetch_static_resource(resource_name: str) -> str:
             "staticResource": resource
         }
 
-        return json.dumps(result, indent=2)
+        return dumps_json(result)
     except Exception as e:
         logger.exception("fetch_static_resource failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -3470,7 +4655,7 @@ def create_static_resource(
     """
     try:
         sf = get_salesforce_connection()
-        api_version = getattr(sf, "sf_version", "59.0")
+        api_version = getattr(sf, "sf_version", _DEFAULT_API_VERSION)
 
         # Generate StaticResource XML
         PNS = "http://soap.sforce.com/2006/04/metadata"
@@ -3509,10 +4694,10 @@ def create_static_resource(
         status = _poll_metadata_rest_deploy_status(sf, dep["id"])
         status["job_id"] = dep["id"]
 
-        return json.dumps(status, indent=2)
+        return dumps_json(status)
     except Exception as e:
         logger.exception("create_static_resource failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -3529,7 +4714,7 @@ def upsert_static_resource(
         return create_static_resource(resource_name, content, content_type, description, cache_control)
     except Exception as e:
         logger.exception("upsert_static_resource failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # =============================================================================
@@ -3552,7 +4737,7 @@ def fetch_custom_metadata_type(type_name: str) -> str:
         response = sf.toolingexecute(f"query/?q={query}")
 
         if not response.get("records"):
-            return json.dumps({"success": False, "error": f"Custom Metadata Type '{type_name}' not found"})
+            return dumps_json({"success": False, "error": f"Custom Metadata Type '{type_name}' not found"})
 
         cmd_type = response["records"][0]
 
@@ -3561,10 +4746,10 @@ def fetch_custom_metadata_type(type_name: str) -> str:
             "customMetadataType": cmd_type
         }
 
-        return json.dumps(result, indent=2)
+        return dumps_json(result)
     except Exception as e:
         logger.exception("fetch_custom_metadata_type failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -3585,10 +4770,10 @@ def create_custom_metadata_type(
     """
     try:
         if not type_name.endswith("__mdt"):
-            return json.dumps({"success": False, "error": "Custom Metadata Type name must end with '__mdt'"})
+            return dumps_json({"success": False, "error": "Custom Metadata Type name must end with '__mdt'"})
 
         sf = get_salesforce_connection()
-        api_version = getattr(sf, "sf_version", "59.0")
+        api_version = getattr(sf, "sf_version", _DEFAULT_API_VERSION)
 
         # Generate CustomObject XML for Custom Metadata Type
         PNS = "http://soap.sforce.com/2006/04/metadata"
@@ -3614,10 +4799,10 @@ def create_custom_metadata_type(
         status = _poll_metadata_rest_deploy_status(sf, dep["id"])
         status["job_id"] = dep["id"]
 
-        return json.dumps(status, indent=2)
+        return dumps_json(status)
     except Exception as e:
         logger.exception("create_custom_metadata_type failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -3633,7 +4818,7 @@ def upsert_custom_metadata_type(
         return create_custom_metadata_type(type_name, label, plural_label, description)
     except Exception as e:
         logger.exception("upsert_custom_metadata_type failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # =============================================================================
@@ -3655,7 +4840,7 @@ def fetch_aura_component(component_name: str) -> str:
         response = sf.toolingexecute(f"query/?q={query}")
 
         if not response.get("records"):
-            return json.dumps({"success": False, "error": f"Aura Component '{component_name}' not found"})
+            return dumps_json({"success": False, "error": f"Aura Component '{component_name}' not found"})
 
         bundle = response["records"][0]
 
@@ -3669,10 +4854,10 @@ def fetch_aura_component(component_name: str) -> str:
             "definitions": def_response.get("records", [])
         }
 
-        return json.dumps(result, indent=2)
+        return dumps_json(result)
     except Exception as e:
         logger.exception("fetch_aura_component failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -3699,7 +4884,7 @@ def create_aura_component(
     """
     try:
         sf = get_salesforce_connection()
-        api_version = getattr(sf, "sf_version", "59.0")
+        api_version = getattr(sf, "sf_version", _DEFAULT_API_VERSION)
 
         # Create component markup
         component_markup = f'''<aura:component description="{description}">
@@ -3730,10 +4915,10 @@ def create_aura_component(
         status = _poll_metadata_rest_deploy_status(sf, dep["id"])
         status["job_id"] = dep["id"]
 
-        return json.dumps(status, indent=2)
+        return dumps_json(status)
     except Exception as e:
         logger.exception("create_aura_component failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -3750,7 +4935,7 @@ def upsert_aura_component(
         return create_aura_component(component_name, description, controller_js, helper_js, style_css)
     except Exception as e:
         logger.exception("upsert_aura_component failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # =============================================================================
@@ -3772,7 +4957,7 @@ def fetch_custom_label(label_name: str) -> str:
         response = sf.toolingexecute(f"query/?q={query}")
 
         if not response.get("records"):
-            return json.dumps({"success": False, "error": f"Custom Label '{label_name}' not found"})
+            return dumps_json({"success": False, "error": f"Custom Label '{label_name}' not found"})
 
         label = response["records"][0]
 
@@ -3781,10 +4966,10 @@ def fetch_custom_label(label_name: str) -> str:
             "label": label
         }
 
-        return json.dumps(result, indent=2)
+        return dumps_json(result)
     except Exception as e:
         logger.exception("fetch_custom_label failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -3809,7 +4994,7 @@ def create_custom_label(
     """
     try:
         sf = get_salesforce_connection()
-        api_version = getattr(sf, "sf_version", "59.0")
+        api_version = getattr(sf, "sf_version", _DEFAULT_API_VERSION)
 
         # Generate CustomLabels XML
         PNS = "http://soap.sforce.com/2006/04/metadata"
@@ -3839,10 +5024,10 @@ def create_custom_label(
         status = _poll_metadata_rest_deploy_status(sf, dep["id"])
         status["job_id"] = dep["id"]
 
-        return json.dumps(status, indent=2)
+        return dumps_json(status)
     except Exception as e:
         logger.exception("create_custom_label failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -3860,7 +5045,7 @@ def upsert_custom_label(
         return create_custom_label(label_name, value, category, language, protected, short_description)
     except Exception as e:
         logger.exception("upsert_custom_label failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # =============================================================================
@@ -3884,7 +5069,7 @@ def fetch_record_type(object_name: str, record_type_name: str) -> str:
         response = sf.query(query)
 
         if not response.get("records"):
-            return json.dumps({"success": False, "error": f"Record Type '{record_type_name}' not found for {object_name}"})
+            return dumps_json({"success": False, "error": f"Record Type '{record_type_name}' not found for {object_name}"})
 
         record_type = response["records"][0]
 
@@ -3893,10 +5078,10 @@ def fetch_record_type(object_name: str, record_type_name: str) -> str:
             "recordType": record_type
         }
 
-        return json.dumps(result, indent=2)
+        return dumps_json(result)
     except Exception as e:
         logger.exception("fetch_record_type failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -3919,7 +5104,7 @@ def create_record_type(
     """
     try:
         sf = get_salesforce_connection()
-        api_version = getattr(sf, "sf_version", "59.0")
+        api_version = getattr(sf, "sf_version", _DEFAULT_API_VERSION)
 
         # Generate RecordType XML
         PNS = "http://soap.sforce.com/2006/04/metadata"
@@ -3947,10 +5132,10 @@ def create_record_type(
         status = _poll_metadata_rest_deploy_status(sf, dep["id"])
         status["job_id"] = dep["id"]
 
-        return json.dumps(status, indent=2)
+        return dumps_json(status)
     except Exception as e:
         logger.exception("create_record_type failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -3967,7 +5152,7 @@ def upsert_record_type(
         return create_record_type(object_name, record_type_name, label, description, active)
     except Exception as e:
         logger.exception("upsert_record_type failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # =============================================================================
@@ -3990,7 +5175,7 @@ def fetch_quick_action(action_name: str) -> str:
         response = sf.toolingexecute(f"query/?q={query}")
 
         if not response.get("records"):
-            return json.dumps({"success": False, "error": f"Quick Action '{action_name}' not found"})
+            return dumps_json({"success": False, "error": f"Quick Action '{action_name}' not found"})
 
         action = response["records"][0]
 
@@ -3999,10 +5184,10 @@ def fetch_quick_action(action_name: str) -> str:
             "quickAction": action
         }
 
-        return json.dumps(result, indent=2)
+        return dumps_json(result)
     except Exception as e:
         logger.exception("fetch_quick_action failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -4027,7 +5212,7 @@ def create_quick_action(
     """
     try:
         sf = get_salesforce_connection()
-        api_version = getattr(sf, "sf_version", "59.0")
+        api_version = getattr(sf, "sf_version", _DEFAULT_API_VERSION)
 
         # Determine if object-specific or global
         is_object_specific = "." in action_name
@@ -4065,10 +5250,10 @@ def create_quick_action(
         status = _poll_metadata_rest_deploy_status(sf, dep["id"])
         status["job_id"] = dep["id"]
 
-        return json.dumps(status, indent=2)
+        return dumps_json(status)
     except Exception as e:
         logger.exception("create_quick_action failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -4085,7 +5270,7 @@ def upsert_quick_action(
         return create_quick_action(action_name, label, action_type, target_object, description)
     except Exception as e:
         logger.exception("upsert_quick_action failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # =============================================================================
@@ -4108,7 +5293,7 @@ def fetch_custom_tab(tab_name: str) -> str:
         response = sf.query(query)
 
         if not response.get("records"):
-            return json.dumps({"success": False, "error": f"Custom Tab '{tab_name}' not found"})
+            return dumps_json({"success": False, "error": f"Custom Tab '{tab_name}' not found"})
 
         tab = response["records"][0]
 
@@ -4117,10 +5302,10 @@ def fetch_custom_tab(tab_name: str) -> str:
             "tab": tab
         }
 
-        return json.dumps(result, indent=2)
+        return dumps_json(result)
     except Exception as e:
         logger.exception("fetch_custom_tab failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -4145,7 +5330,7 @@ def create_custom_tab(
     """
     try:
         sf = get_salesforce_connection()
-        api_version = getattr(sf, "sf_version", "59.0")
+        api_version = getattr(sf, "sf_version", _DEFAULT_API_VERSION)
 
         # Generate CustomTab XML
         PNS = "http://soap.sforce.com/2006/04/metadata"
@@ -4178,10 +5363,10 @@ def create_custom_tab(
         status = _poll_metadata_rest_deploy_status(sf, dep["id"])
         status["job_id"] = dep["id"]
 
-        return json.dumps(status, indent=2)
+        return dumps_json(status)
     except Exception as e:
         logger.exception("create_custom_tab failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
 
 
 # DEPRECATED: Use deploy_metadata or fetch_metadata instead
@@ -4199,4 +5384,4 @@ def upsert_custom_tab(
         return create_custom_tab(tab_name, label, tab_style, sobject, url, description)
     except Exception as e:
         logger.exception("upsert_custom_tab failed")
-        return json.dumps({"success": False, "error": str(e)})
+        return dumps_json({"success": False, "error": str(e)})
@@ -7,7 +7,7 @@ import json
 from typing import Optional
 
 from app.mcp.server import register_tool
-from app.services.salesforce import get_salesforce_connection
+from app.services.salesforce import get_salesforce_connection, get_http_session
 from app.mcp.tools.utils import (
     format_error_response,
     format_success_response,
@@ -43,8 +43,8 @@ def salesforce_health_check() -> str:
         try:
             # Simple identity check
             identity_url = f"{sf.base_url}sobjects/"
-            import requests
-            response = requests.get(
+            http = get_http_session()
+            response = http.get(
                 identity_url,
                 headers={"Authorization": f"Bearer {sf.session_id}"},
                 timeout=10
@@ -149,8 +149,8 @@ def get_org_limits() -> str:
 
         # Query org limits via REST API
         endpoint = f"{sf.base_url}limits"
-        import requests
-        response = requests.get(
+        http = get_http_session()
+        response = http.get(
             endpoint,
             headers={"Authorization": f"Bearer {sf.session_id}"},
             timeout=30
@@ -8,7 +8,7 @@ import time
 from typing import List, Optional, Dict, Any
 
 from app.mcp.server import register_tool
-from app.services.salesforce import get_salesforce_connection
+from app.services.salesforce import get_salesforce_connection, get_http_session
 from app.mcp.tools.utils import (
     format_error_response,
     format_success_response,
@@ -54,8 +54,8 @@ def run_apex_tests(
             "Content-Type": "application/json"
         }
 
-        import requests
-        response = requests.post(endpoint, headers=headers, json=test_request, timeout=30)
+        http = get_http_session()
+        response = http.post(endpoint, headers=headers, json=test_request, timeout=30)
         response.raise_for_status()
         test_run_id = response.text.strip('"')
 
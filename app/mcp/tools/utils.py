@@ -6,6 +6,13 @@ import json
 import logging
 from typing import Any, Dict, Optional
 
+from app.config import get_config
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Token limits
@@ -146,7 +153,7 @@ class ResponseSizeManager:
         Returns:
             Response dict with size warnings if applicable
         """
-        response_json = json.dumps(response_dict, indent=2)
+        response_json = dumps_json(response_dict)
         estimated_tokens = ResponseSizeManager.estimate_token_count(response_json)
 
         # Add size metadata
@@ -205,6 +212,34 @@ class ResponseSizeManager:
         return data, False, None
 
 
+def dumps_json(obj: Any, pretty: Optional[bool] = None) -> str:
+    """Serialize a tool response to JSON.
+
+    Compact by default; uses orjson when it is installed, otherwise the
+    stdlib encoder. Pass `pretty=True` (or set SFMCP_PRETTY_JSON=true) for
+    indented, human-readable output.
+    """
+    if pretty is None:
+        pretty = get_config().pretty_json
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, default=str, option=orjson.OPT_INDENT_2 if pretty else 0
+            ).decode("utf-8")
+        except TypeError:
+            pass  # e.g. non-str dict keys; fall back to the stdlib encoder
+    if pretty:
+        return json.dumps(obj, indent=2, default=str)
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+def loads_json(data: Any) -> Any:
+    """Parse JSON from `bytes` or `str`, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def format_success_response(
     data: Any,
     context: Optional[Dict[str, Any]] = None,
@@ -233,7 +268,7 @@ def format_success_response(
     if check_size:
         response = ResponseSizeManager.check_response_size(response)
 
-    return json.dumps(response, indent=2)
+    return dumps_json(response)
 
 
 def format_error_response(
@@ -263,7 +298,7 @@ def format_error_response(
         if context:
             response["context"] = context
 
-    return json.dumps(response, indent=2)
+    return dumps_json(response)
 
 
 # Convenience functions for common operations
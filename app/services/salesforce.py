@@ -1,8 +1,12 @@
 """Salesforce connection management with OAuth support"""
 from simple_salesforce import Salesforce
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import requests
 import threading
 import time
 import logging
+from typing import Dict, Optional, Set, Tuple
 
 from app.config import get_config
 
@@ -16,8 +20,83 @@ except ImportError:
     OAUTH_AVAILABLE = False
     logger.warning("⚠️ OAuth module not available")
 
-# Thread-local storage
-local = threading.local()
+# Process-wide connection cache (writes guarded by _connection_lock):
+# requested user key (user_id, active org, or None) -> (connection, expires_at, selected user)
+_connection_lock = threading.Lock()
+_connections: Dict[Optional[str], Tuple[Salesforce, float, str]] = {}
+# Users whose access token Salesforce rejected (401) before our TTL ran out
+_rejected_users: Set[str] = set()
+_http_session = None
+
+
+def _check_session_rejected(resp, *args, **kwargs):
+    """Response hook: a 401 means that request's access token is no longer valid.
+
+    Drop the cached connection(s) using that token and mark their user, so the
+    next `get_salesforce_connection()` for that user refreshes the token;
+    other orgs' connections are left alone.
+    """
+    if resp.status_code != 401:
+        return
+    auth = resp.request.headers.get("Authorization", "")
+    if not auth.startswith("Bearer "):
+        return
+    token = auth[len("Bearer "):]
+    for key, (conn, _, user) in list(_connections.items()):
+        if conn.session_id == token:
+            _rejected_users.add(user)
+            _connections.pop(key, None)
+
+
+def _active_user_id() -> Optional[str]:
+    """The multi_org active org's user id, if one is selected."""
+    try:
+        from app.mcp.tools.multi_org import _active_org
+    except ImportError:
+        return None
+    return _active_org.get("user_id")
+
+
+def _cached_connection(key: Optional[str]):
+    entry = _connections.get(key)
+    if entry is not None and time.time() < entry[1]:
+        return entry[0]
+    return None
+
+
+def get_http_session() -> requests.Session:
+    """
+    Return the shared keep-alive HTTP session used for all Salesforce calls.
+
+    The session pools HTTPS connections so TLS handshakes are paid once per
+    host instead of once per request, and retries transient connection errors.
+    """
+    global _http_session
+    if _http_session is None:
+        with _connection_lock:
+            if _http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=10,
+                    pool_maxsize=20,
+                    # Idempotent requests are also retried on throttling/gateway
+                    # errors, honouring Retry-After; the last response is returned
+                    # (not raised) so callers' error handling still sees it.
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.3,
+                        status_forcelist=(429, 502, 503, 504),
+                        respect_retry_after_header=True,
+                        raise_on_status=False,
+                    ),
+                )
+                session.mount("https://", adapter)
+                # Tooling/REST JSON (e.g. LWC/Apex source) compresses well
+                session.headers["Accept-Encoding"] = "gzip, deflate"
+                session.hooks["response"].append(_check_session_rejected)
+                _http_session = session
+    return _http_session
+
 
 def get_salesforce_connection(user_id: str = None):
     """
@@ -32,7 +111,19 @@ def get_salesforce_connection(user_id: str = None):
     Returns:
         Salesforce connection instance
     """
-    if not hasattr(local, 'sf_connection') or local.sf_connection is None:
+    # Connections are cached per requested org so multi-org callers (e.g.
+    # advanced_comparison with org2_user_id) never share one client.
+    cache_key = user_id or _active_user_id()
+    conn = _cached_connection(cache_key)
+    if conn is not None:
+        return conn
+
+    session = get_http_session()
+    with _connection_lock:
+        conn = _cached_connection(cache_key)
+        if conn is not None:
+            return conn
+
         logger.info("🔗 Creating Salesforce connection...")
 
         if not OAUTH_AVAILABLE:
@@ -68,24 +159,32 @@ def get_salesforce_connection(user_id: str = None):
         # Check token age and refresh if needed
         config = get_config()
         token_age = time.time() - token_data['login_timestamp']
-        if token_age > config.token_refresh_threshold_seconds:
+        if selected_user in _rejected_users or token_age > config.token_refresh_threshold_seconds:
             logger.info(f"🔄 Refreshing token for {selected_user}...")
             if not refresh_salesforce_token(selected_user):
                 raise Exception(f"Failed to refresh token for {selected_user}. Please login again.")
             # Get updated token
             token_data = get_stored_tokens()[selected_user]
+            token_age = time.time() - token_data['login_timestamp']
+            _rejected_users.discard(selected_user)
 
-        # Create connection
-        local.sf_connection = Salesforce(
+        # Create connection (reuses the pooled HTTP session)
+        conn = Salesforce(
             instance_url=token_data['instance_url'],
-            session_id=token_data['access_token']
+            session_id=token_data['access_token'],
+            session=session
         )
 
+        # Reuse until the token reaches the refresh threshold, then rebuild
+        # (which refreshes the token) on the next call.
+        expires_at = time.time() + config.token_refresh_threshold_seconds - token_age
+        _connections[cache_key] = (conn, expires_at, selected_user)
+
         logger.info(f"✅ Connected to {token_data['instance_url']} as user {selected_user}")
 
-    return local.sf_connection
+    return conn
 
 def clear_connection_cache():
     """Clear connection cache to force new connection"""
-    if hasattr(local, 'sf_connection'):
-        local.sf_connection = None
+    with _connection_lock:
+        _connections.clear()